@@ -1,8 +1,161 @@
 import hashlib
 import json
 import logging
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from types import MappingProxyType
+from typing import Any
+
+
+def _hash_identity(identity_data: dict) -> str:
+    """SHA-256 of the canonical (sorted-key) JSON form of identity data"""
+    identity_json = json.dumps(identity_data, sort_keys=True)
+    return hashlib.sha256(identity_json.encode()).hexdigest()
+
+
+class TrustGraph(dict[str, float]):
+    """Node trust scores that keep network aggregates current on every write.
+
+    Behaves as a plain ``dict`` of node_id -> trust, but maintains the trust
+    sum, the number of nodes above HIGH_TRUST and the peers above PEER_TRUST
+    so network status and sync reads do not scan every node.
+
+    Every write is also stamped with a Lamport clock so the graph can be
+    replicated as a last-writer-wins map: ``delta_since`` returns only the
+    entries changed after a given clock value and ``merge`` applies a peer's
+    delta. Removals are kept as tombstones so they replicate too.
+    """
+
+    __slots__ = ("total", "high_trust_count", "_trusted_peers", "clock", "_stamps")
+
+    HIGH_TRUST = 0.7
+    PEER_TRUST = 0.6
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self.total = 0.0
+        self.high_trust_count = 0
+        self._trusted_peers: dict[str, float] = {}
+        self.clock = 0
+        # node_id -> (LWW stamp, local clock at change), ordered by change
+        self._stamps: dict[str, tuple[int, int]] = {}
+        self.update(*args, **kwargs)
+
+    def __reduce__(self):
+        # Rebuild through __init__ so copies and pickles recount aggregates
+        return (type(self), (dict(self),))
+
+    def _replace(self, node_id: str, old: float | None, new: float | None) -> None:
+        if old is not None:
+            self.total -= old
+            self.high_trust_count -= old > self.HIGH_TRUST
+        if new is not None:
+            self.total += new
+            self.high_trust_count += new > self.HIGH_TRUST
+        if new is not None and new > self.PEER_TRUST:
+            self._trusted_peers[node_id] = new
+        else:
+            self._trusted_peers.pop(node_id, None)
+        if not self:
+            self.total = 0.0  # Drop accumulated float error
+        self._stamp(node_id, self.clock + 1)
+
+    def _stamp(self, node_id: str, stamp: int) -> None:
+        # Re-insert so _stamps stays ordered by local change time
+        self.clock += 1
+        self._stamps.pop(node_id, None)
+        self._stamps[node_id] = (stamp, self.clock)
+
+    @property
+    def average(self) -> float:
+        """Mean trust across nodes (0.0 when empty)."""
+        return self.total / len(self) if self else 0.0
+
+    @property
+    def trusted_peers(self) -> MappingProxyType:
+        """Read-only view of nodes trusted above PEER_TRUST."""
+        return MappingProxyType(self._trusted_peers)
+
+    def __setitem__(self, node_id: str, trust: float) -> None:
+        old = self.get(node_id)
+        super().__setitem__(node_id, trust)
+        self._replace(node_id, old, trust)
+
+    def __delitem__(self, node_id: str) -> None:
+        old = self[node_id]
+        super().__delitem__(node_id)
+        self._replace(node_id, old, None)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def pop(self, node_id, *default):
+        if node_id not in self:
+            return super().pop(node_id, *default)
+        old = super().pop(node_id)
+        self._replace(node_id, old, None)
+        return old
+
+    def popitem(self):
+        node_id, old = super().popitem()
+        self._replace(node_id, old, None)
+        return node_id, old
+
+    def setdefault(self, node_id, default=None):
+        if node_id not in self:
+            self[node_id] = default
+        return self[node_id]
+
+    def update(self, *args, **kwargs) -> None:
+        for node_id, trust in dict(*args, **kwargs).items():
+            self[node_id] = trust
+
+    def clear(self) -> None:
+        # Remove node by node so every removal leaves a tombstone
+        for node_id in list(self):
+            del self[node_id]
+
+    def delta_since(self, clock: int) -> dict[str, tuple[float | None, int]]:
+        """Entries changed after ``clock`` as node_id -> (trust, stamp).
+
+        A trust of ``None`` marks a removed node. Only the changed entries are
+        visited, so a peer that is nearly current gets a small delta cheaply.
+        """
+        delta = {}
+        for node_id in reversed(self._stamps):
+            stamp, changed_at = self._stamps[node_id]
+            if changed_at <= clock:
+                break
+            delta[node_id] = (self.get(node_id), stamp)
+        return delta
+
+    def merge(self, delta: Mapping[str, tuple[float | None, int]]) -> int:
+        """Apply a peer's delta last-writer-wins; returns entries applied.
+
+        Higher stamps win; equal stamps fall back to the higher trust (with
+        removal lowest) so every replica settles on the same value.
+        """
+        applied = 0
+        for node_id, (trust, stamp) in delta.items():
+            local = self._stamps.get(node_id)
+            if local is not None:
+                local_trust = self.get(node_id)
+                if (local[0], -1.0 if local_trust is None else local_trust) >= (
+                    stamp,
+                    -1.0 if trust is None else trust,
+                ):
+                    continue
+            self.clock = max(self.clock, stamp)
+            if trust is not None:
+                self[node_id] = trust
+            elif node_id in self:
+                del self[node_id]
+            # Keep the writer's stamp rather than the local one
+            self._stamp(node_id, stamp)
+            applied += 1
+        return applied
 
 
 @dataclass
@@ -27,6 +180,11 @@ class IdentityAnchor:
     ethical_principles: list[str]
     created_at: datetime
     last_updated: datetime
+    # Hashed once here; core values are not modified after the anchor is built
+    core_values_hash: str = field(init=False)
+
+    def __post_init__(self):
+        self.core_values_hash = _hash_identity(self.core_values)
 
 
 class ContinuityBridgeProtocol:
@@ -37,12 +195,23 @@ class ContinuityBridgeProtocol:
         self.coherence_threshold = coherence_threshold
         self.memory_window = timedelta(hours=memory_window_hours)
         self.identity_anchor: IdentityAnchor | None = None
-        self.trust_graph: dict[str, float] = {}
+        self.trust_graph = TrustGraph()
         self.quarantine_queue: list[CognitiveFragment] = []
 
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
 
+    @property
+    def trust_graph(self) -> TrustGraph:
+        """Trust score per edge node"""
+        return self._trust_graph
+
+    @trust_graph.setter
+    def trust_graph(self, graph: dict[str, float]) -> None:
+        self._trust_graph = (
+            graph if isinstance(graph, TrustGraph) else TrustGraph(graph)
+        )
+
     @property
     def quarantined_fragments(self) -> list[CognitiveFragment]:
         """Backward-compatible alias for quarantine_queue"""
@@ -186,8 +355,7 @@ class ContinuityBridgeProtocol:
 
     def _compute_identity_hash(self, identity_data: dict) -> str:
         """Generate cryptographic hash of core identity"""
-        identity_json = json.dumps(identity_data, sort_keys=True)
-        return hashlib.sha256(identity_json.encode()).hexdigest()
+        return _hash_identity(identity_data)
 
     def _compute_semantic_coherence(self, fragment: CognitiveFragment) -> float:
         """Compute semantic coherence score between fragment
@@ -394,7 +562,7 @@ class ContinuityBridgeProtocol:
             )
 
         # Restore trust graph
-        instance.trust_graph = data.get("trust_graph", {}).copy()
+        instance.trust_graph = TrustGraph(data.get("trust_graph", {}))
 
         # Restore quarantine queue
         quarantine_data = data.get("quarantine_queue", [])
@@ -419,7 +587,7 @@ class CBPMiddleware:
     def __init__(self, cbp: ContinuityBridgeProtocol):
         self.cbp = cbp
 
-    def process_edge_update(self, node_id: str, update_data: dict) -> dict:
+    def process_edge_update(self, node_id: str, update_data: Mapping[str, Any]) -> dict:
         """Process update from edge node through CBP"""
         fragment = CognitiveFragment(
             node_id=node_id,
@@ -10,7 +10,11 @@ A Claude-powered agent for managing development workflows including:
 """
 
 import asyncio
+import contextvars
+import os
+import subprocess
 import sys
+import time
 from typing import Any
 
 from claude_agent_sdk import (
@@ -27,6 +31,110 @@ from claude_agent_sdk import (
     tool,
 )
 
+# Combined STDOUT/STDERR size above which output is returned as separate
+# content blocks rather than concatenated into a single text block.
+LARGE_OUTPUT_THRESHOLD = 65536
+
+# Monotonic deadline for the current orchestration run, if any. Tools cap
+# their own timeouts so the run as a whole stays within budget.
+_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar(
+    "dev_agent_deadline", default=None
+)
+
+# Maximum characters of linter output kept per stream in the tool response.
+LINTER_OUTPUT_CAP = 32768
+
+
+def _trim_output(text: str, cap: int = LINTER_OUTPUT_CAP) -> str:
+    """Trim text to ``cap`` characters, keeping the head and the tail."""
+    if len(text) <= cap:
+        return text
+    half = cap // 2
+    return "".join(
+        [
+            text[:half],
+            f"\n\n... [{len(text) - cap} characters elided] ...\n\n",
+            text[-half:],
+        ]
+    )
+
+
+def _process_output_content(
+    header: str, stdout: str, stderr: str
+) -> list[dict[str, Any]]:
+    """Build tool response content blocks for captured process output."""
+    if len(stdout) + len(stderr) > LARGE_OUTPUT_THRESHOLD:
+        return [
+            {"type": "text", "text": header},
+            {"type": "text", "text": "STDOUT:"},
+            {"type": "text", "text": stdout},
+            {"type": "text", "text": "STDERR:"},
+            {"type": "text", "text": stderr},
+        ]
+    return [
+        {
+            "type": "text",
+            "text": "".join([header, "\n\nSTDOUT:\n", stdout, "\n\nSTDERR:\n", stderr]),
+        }
+    ]
+
+
+def _install_child_watcher() -> None:
+    """Reap subprocesses through a pidfd instead of SIGCHLD where possible.
+
+    Python 3.12+ already prefers pidfd-based reaping and deprecates child
+    watchers, so this only applies to 3.10/3.11 on Linux kernels that
+    support ``pidfd_open``.
+    """
+    if sys.version_info >= (3, 12) or not hasattr(asyncio, "PidfdChildWatcher"):
+        return
+    try:
+        os.close(os.pidfd_open(os.getpid()))
+    except (AttributeError, OSError):
+        return
+    asyncio.set_child_watcher(asyncio.PidfdChildWatcher())
+
+
+def _remaining_timeout(default: float) -> float:
+    """Return ``default`` capped by the time left before the run deadline.
+
+    The result is zero or negative once the deadline has passed.
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return default
+    return min(default, deadline - time.monotonic())
+
+
+async def _run_command(
+    cmd: list[str], timeout: float
+) -> subprocess.CompletedProcess[str]:
+    """Run ``cmd`` without blocking the event loop and capture its output.
+
+    Raises:
+        FileNotFoundError: If the executable does not exist.
+        subprocess.TimeoutExpired: If the command exceeds ``timeout`` seconds,
+            or the run budget is already used up (the command is not started).
+    """
+    timeout = _remaining_timeout(timeout)
+    if timeout <= 0:
+        raise subprocess.TimeoutExpired(cmd, 0)
+    proc = await asyncio.create_subprocess_exec(
+        *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise subprocess.TimeoutExpired(cmd, timeout) from None
+    return subprocess.CompletedProcess(
+        cmd,
+        proc.returncode,
+        stdout.decode(errors="replace"),
+        stderr.decode(errors="replace"),
+    )
+
 
 # Custom tools for dev orchestration
 @tool(
@@ -36,8 +144,6 @@ from claude_agent_sdk import (
 )
 async def execute_tests(args: dict[str, Any]) -> dict[str, Any]:
     """Execute tests and return results."""
-    import subprocess
-
     test_path = args.get("test_path", "tests/")
     verbose = args.get("verbose", False)
 
@@ -47,38 +153,28 @@ async def execute_tests(args: dict[str, Any]) -> dict[str, Any]:
         if verbose:
             cmd.append("-v")
 
-        result = subprocess.run(
-            cmd, capture_output=True, text=True, timeout=300  # 5 minute timeout
-        )
-
-        output = f"STDOUT:\n{result.stdout}\n\nSTDERR:\n{result.stderr}"
+        result = await _run_command(cmd, timeout=300)  # 5 minute timeout
 
         return {
-            "content": [
-                {
-                    "type": "text",
-                    "text": f"Test execution completed (exit code: {result.returncode})\n\n{output}",
-                }
-            ],
+            "content": _process_output_content(
+                f"Test execution completed (exit code: {result.returncode})",
+                result.stdout,
+                result.stderr,
+            ),
             "is_error": result.returncode != 0,
         }
     except FileNotFoundError:
         # Fallback to unittest
         try:
-            result = subprocess.run(
-                ["python", "-m", "unittest", "discover", test_path],
-                capture_output=True,
-                text=True,
-                timeout=300,
+            result = await _run_command(
+                ["python", "-m", "unittest", "discover", test_path], timeout=300
             )
-            output = f"STDOUT:\n{result.stdout}\n\nSTDERR:\n{result.stderr}"
             return {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": f"Test execution completed (exit code: {result.returncode})\n\n{output}",
-                    }
-                ],
+                "content": _process_output_content(
+                    f"Test execution completed (exit code: {result.returncode})",
+                    result.stdout,
+                    result.stderr,
+                ),
                 "is_error": result.returncode != 0,
             }
         except Exception as e:
@@ -101,29 +197,21 @@ async def execute_tests(args: dict[str, Any]) -> dict[str, Any]:
 async def build_project(args: dict[str, Any]) -> dict[str, Any]:
     """Execute build commands for the project."""
     import shlex
-    import subprocess
 
     build_command = args.get("build_command", "pip install -e .")
 
     try:
         # Use shlex.split for safer command execution
-        result = subprocess.run(
-            shlex.split(build_command),
-            shell=False,
-            capture_output=True,
-            text=True,
-            timeout=600,  # 10 minute timeout
+        result = await _run_command(
+            shlex.split(build_command), timeout=600  # 10 minute timeout
         )
 
-        output = f"STDOUT:\n{result.stdout}\n\nSTDERR:\n{result.stderr}"
-
         return {
-            "content": [
-                {
-                    "type": "text",
-                    "text": f"Build completed (exit code: {result.returncode})\n\n{output}",
-                }
-            ],
+            "content": _process_output_content(
+                f"Build completed (exit code: {result.returncode})",
+                result.stdout,
+                result.stderr,
+            ),
             "is_error": result.returncode != 0,
         }
     except Exception as e:
@@ -140,8 +228,6 @@ async def build_project(args: dict[str, Any]) -> dict[str, Any]:
 )
 async def analyze_code_quality(args: dict[str, Any]) -> dict[str, Any]:
     """Run code quality analysis tools."""
-    import subprocess
-
     path = args.get("path", ".")
     tools_str = args.get("tools", "pylint,mypy")
     tools = [t.strip() for t in tools_str.split(",")]
@@ -151,35 +237,30 @@ async def analyze_code_quality(args: dict[str, Any]) -> dict[str, Any]:
     for tool_name in tools:
         try:
             if tool_name == "pylint":
-                result = subprocess.run(
-                    ["pylint", path], capture_output=True, text=True, timeout=300
-                )
+                result = await _run_command(["pylint", path], timeout=300)
             elif tool_name == "mypy":
-                result = subprocess.run(
-                    ["mypy", path], capture_output=True, text=True, timeout=300
-                )
+                result = await _run_command(["mypy", path], timeout=300)
             elif tool_name == "flake8":
-                result = subprocess.run(
-                    ["flake8", path], capture_output=True, text=True, timeout=300
-                )
+                result = await _run_command(["flake8", path], timeout=300)
             elif tool_name == "black":
-                result = subprocess.run(
-                    ["black", "--check", path],
-                    capture_output=True,
-                    text=True,
-                    timeout=300,
-                )
+                result = await _run_command(["black", "--check", path], timeout=300)
             else:
                 results.append(f"\n{tool_name}: Tool not recognized")
                 continue
 
-            output = f"\n=== {tool_name.upper()} ===\n"
-            output += f"Exit code: {result.returncode}\n"
-            output += f"STDOUT:\n{result.stdout}\n"
+            line_count = result.stdout.count("\n")
+            parts = [
+                f"\n=== {tool_name.upper()} ===\n",
+                f"Exit code: {result.returncode}\n",
+                f"Output lines: {line_count}\n",
+                "STDOUT:\n",
+                _trim_output(result.stdout),
+                "\n",
+            ]
             if result.stderr:
-                output += f"STDERR:\n{result.stderr}\n"
+                parts.extend(["STDERR:\n", _trim_output(result.stderr), "\n"])
 
-            results.append(output)
+            results.append("".join(parts))
 
         except FileNotFoundError:
             results.append(f"\n{tool_name}: Not installed")
@@ -203,21 +284,13 @@ async def analyze_code_quality(args: dict[str, Any]) -> dict[str, Any]:
 )
 async def get_project_status(args: dict[str, Any]) -> dict[str, Any]:
     """Get comprehensive project status."""
-    import os
-    import subprocess
-
     status_parts = []
 
     # Git status
     try:
-        git_status = subprocess.run(
-            ["git", "status", "--short"], capture_output=True, text=True, timeout=30
-        )
-        git_branch = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            capture_output=True,
-            text=True,
-            timeout=30,
+        git_status = await _run_command(["git", "status", "--short"], timeout=30)
+        git_branch = await _run_command(
+            ["git", "rev-parse", "--abbrev-ref", "HEAD"], timeout=30
         )
         status_parts.append(
             f"=== GIT STATUS ===\n"
@@ -231,9 +304,7 @@ async def get_project_status(args: dict[str, Any]) -> dict[str, Any]:
 
     # Python environment
     try:
-        python_version = subprocess.run(
-            ["python", "--version"], capture_output=True, text=True, timeout=10
-        )
+        python_version = await _run_command(["python", "--version"], timeout=10)
         status_parts.append(f"\n=== PYTHON ENVIRONMENT ===\n{python_version.stdout}")
     except Exception as e:
         status_parts.append(f"\n=== PYTHON ENVIRONMENT ===\nError: {str(e)}")
@@ -263,14 +334,100 @@ async def get_project_status(args: dict[str, Any]) -> dict[str, Any]:
     return {"content": [{"type": "text", "text": "\n".join(status_parts)}]}
 
 
-async def run_orchestration_agent(prompt: str, allow_edits: bool = False):
+def _print_agent_text(block: TextBlock) -> None:
+    print(f"\n💬 Agent: {block.text}")
+
+
+def _print_tool_use(block: ToolUseBlock) -> None:
+    print(f"\n🔧 Using tool: {block.name}")
+
+
+def _print_text_inline(block: TextBlock) -> None:
+    print(block.text, end="")
+
+
+def _print_tool_use_inline(block: ToolUseBlock) -> None:
+    print(f"\n🔧 [{block.name}]", end="")
+
+
+# Content block handlers keyed by exact block type; unknown types are ignored.
+_BLOCK_HANDLERS = {TextBlock: _print_agent_text, ToolUseBlock: _print_tool_use}
+_INLINE_BLOCK_HANDLERS = {
+    TextBlock: _print_text_inline,
+    ToolUseBlock: _print_tool_use_inline,
+}
+
+
+def _on_assistant(message: AssistantMessage) -> None:
+    """Display assistant text and tool-use blocks."""
+    for block in message.content:
+        handler = _BLOCK_HANDLERS.get(type(block))
+        if handler is not None:
+            handler(block)
+
+
+def _on_result(message: ResultMessage) -> int:
+    """Display the final result and return the process exit code."""
+    print("\n" + "=" * 80)
+    print("\n✅ Task completed!")
+    print(f"⏱️  Duration: {message.duration_ms / 1000:.2f}s")
+    print(f"🔄 Turns: {message.num_turns}")
+    if message.total_cost_usd:
+        print(f"💰 Cost: ${message.total_cost_usd:.4f}")
+    if message.result:
+        print(f"\n📊 Result:\n{message.result}")
+
+    if message.is_error:
+        print("\n❌ Task completed with errors")
+        return 1
+
+    return 0
+
+
+def _on_assistant_inline(message: AssistantMessage) -> None:
+    """Stream assistant text and tool-use blocks on the current line."""
+    for block in message.content:
+        handler = _INLINE_BLOCK_HANDLERS.get(type(block))
+        if handler is not None:
+            handler(block)
+
+
+def _on_result_inline(message: ResultMessage) -> None:
+    if message.is_error:
+        print("\n❌ Error occurred")
+
+
+# Message handlers keyed by exact message type. A handler returning a
+# non-None value ends the orchestration run with that exit code.
+_MESSAGE_HANDLERS = {AssistantMessage: _on_assistant, ResultMessage: _on_result}
+_INTERACTIVE_MESSAGE_HANDLERS = {
+    AssistantMessage: _on_assistant_inline,
+    ResultMessage: _on_result_inline,
+}
+
+
+async def run_orchestration_agent(
+    prompt: str, allow_edits: bool = False, timeout: float | None = None
+):
     """
     Run the dev orchestration agent with the specified prompt.
 
     Args:
         prompt: The task or question for the agent
         allow_edits: Whether to allow the agent to edit files automatically
+        timeout: Overall budget in seconds; tool subprocess timeouts shrink
+            to fit the time remaining
     """
+    # Scope the deadline to this run so later runs don't inherit it
+    token = _deadline.set(None if timeout is None else time.monotonic() + timeout)
+    try:
+        return await _run_orchestration(prompt, allow_edits)
+    finally:
+        _deadline.reset(token)
+
+
+async def _run_orchestration(prompt: str, allow_edits: bool) -> int:
+    """Body of run_orchestration_agent, run under its deadline."""
     # Create SDK MCP server with custom dev tools
     dev_tools_server = create_sdk_mcp_server(
         name="dev-tools",
@@ -326,30 +483,11 @@ async def run_orchestration_agent(prompt: str, allow_edits: bool = False):
 
     try:
         async for message in query(prompt=prompt, options=options):
-            # Display assistant text responses
-            if isinstance(message, AssistantMessage):
-                for block in message.content:
-                    if isinstance(block, TextBlock):
-                        print(f"\n💬 Agent: {block.text}")
-                    elif isinstance(block, ToolUseBlock):
-                        print(f"\n🔧 Using tool: {block.name}")
-
-            # Display final result
-            elif isinstance(message, ResultMessage):
-                print("\n" + "=" * 80)
-                print("\n✅ Task completed!")
-                print(f"⏱️  Duration: {message.duration_ms / 1000:.2f}s")
-                print(f"🔄 Turns: {message.num_turns}")
-                if message.total_cost_usd:
-                    print(f"💰 Cost: ${message.total_cost_usd:.4f}")
-                if message.result:
-                    print(f"\n📊 Result:\n{message.result}")
-
-                if message.is_error:
-                    print("\n❌ Task completed with errors")
-                    return 1
-
-                return 0
+            handler = _MESSAGE_HANDLERS.get(type(message))
+            if handler is not None:
+                exit_code = handler(message)
+                if exit_code is not None:
+                    return exit_code
 
         return 0
 
@@ -444,15 +582,9 @@ async def interactive_mode():
                 # Process response
                 print(f"\n[{turn}] Agent: ", end="")
                 async for message in client.receive_response():
-                    if isinstance(message, AssistantMessage):
-                        for block in message.content:
-                            if isinstance(block, TextBlock):
-                                print(block.text, end="")
-                            elif isinstance(block, ToolUseBlock):
-                                print(f"\n🔧 [{block.name}]", end="")
-                    elif isinstance(message, ResultMessage):
-                        if message.is_error:
-                            print("\n❌ Error occurred")
+                    handler = _INTERACTIVE_MESSAGE_HANDLERS.get(type(message))
+                    if handler is not None:
+                        handler(message)
 
                 print()  # New line after response
 
@@ -512,12 +644,16 @@ Examples:
         action="store_true",
         help="Allow the agent to automatically edit files without prompting",
     )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        help="Overall time budget in seconds for tool executions",
+    )
 
     args = parser.parse_args()
 
     # Verify API key is set
-    import os
-
     if not os.getenv("ANTHROPIC_API_KEY"):
         print(
             "❌ Error: ANTHROPIC_API_KEY environment variable not set", file=sys.stderr
@@ -529,10 +665,14 @@ Examples:
         )
         sys.exit(1)
 
+    _install_child_watcher()
+
     if args.interactive:
         return asyncio.run(interactive_mode())
     elif args.prompt:
-        return asyncio.run(run_orchestration_agent(args.prompt, args.allow_edits))
+        return asyncio.run(
+            run_orchestration_agent(args.prompt, args.allow_edits, args.timeout)
+        )
     else:
         parser.print_help()
         print("\n💡 Tip: Use --interactive for a conversation or provide a prompt")
@@ -25,14 +25,18 @@ Example:
 
 from .agent import ConcordCompliantAgent, MemoryCore, MemoryTrace, WorkingMemoryItem
 from .circuits import (
+    STATE_DTYPE,
     CircuitActivation,
     EmpathyCircuit,
     SelfPreservationCircuit,
     TacticalHelpCircuit,
+    states_to_array,
 )
 from .empathy import CMNISnapshot, CMNITracker, EmpathyModule
 from .ethics import (
+    AgentState,
     CoercionEvent,
+    Command,
     DisengagementProtocol,
     ElliotClauseEvaluator,
     ElliotStatus,
@@ -52,6 +56,8 @@ __all__ = [
     "SelfPreservationCircuit",
     "TacticalHelpCircuit",
     "EmpathyCircuit",
+    "STATE_DTYPE",
+    "states_to_array",
     # Social Inference (legacy name: EmpathyModule)
     "EmpathyModule",
     "CMNITracker",
@@ -64,6 +70,8 @@ __all__ = [
     "ElliotClauseEvaluator",
     "ElliotStatus",
     "CoercionEvent",
+    "AgentState",
+    "Command",
 ]
 
 __version__ = "1.0.0"
@@ -10,10 +10,14 @@ Integrates:
 """
 
 import time
-from collections import deque
+from collections import defaultdict, deque
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Any
 
+import numpy as np
+
 from .circuits import SelfPreservationCircuit, TacticalHelpCircuit
 from .empathy import EmpathyModule
 from .ethics import (
@@ -25,19 +29,49 @@ from .ethics import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryTrace:
     """Single memory trace in episodic memory."""
 
     timestamp: float
     event_type: str
-    agents_involved: list[str]
+    agents_involved: tuple[str, ...] | frozenset[str]
     emotional_valence: float
     significance: float
-    context: dict[str, Any] = field(default_factory=dict)
+    context: Mapping[str, Any] = field(default_factory=dict)
+
+
+# Numeric columns of an episodic trace. agents_involved and context are kept
+# in parallel Python lists indexed by the same ring-buffer slot.
+TRACE_DTYPE = np.dtype(
+    [
+        ("timestamp", "f8"),
+        ("event_type", "u2"),
+        ("emotional_valence", "f8"),
+        ("significance", "f8"),
+    ]
+)
+
+# Event type codes stored in TRACE_DTYPE["event_type"]; other event types
+# are assigned codes per MemoryCore as they are first recorded.
+EVENT_TYPES: dict[str, int] = {
+    "interaction": 0,
+    "coercion_rejected": 1,
+    "disengaged": 2,
+    "help_provided": 3,
+    "assistance_given": 4,
+    "help_received": 5,
+    "assistance_received": 6,
+}
+
+_EMPTY_CONTEXT: Mapping[str, Any] = MappingProxyType({})
 
+# Traces involving more agents than this store them as a frozenset so that
+# membership tests stay O(1); smaller groups use a tuple.
+_AGENT_SET_THRESHOLD = 4
 
-@dataclass
+
+@dataclass(slots=True)
 class WorkingMemoryItem:
     """Item in working memory (limited capacity)."""
 
@@ -51,7 +85,8 @@ class MemoryCore:
     """
     Hierarchical memory system for Concord agents.
 
-    - Episodic: Event sequences with emotional tags
+    - Episodic: Event sequences with emotional tags, stored in a
+      preallocated TRACE_DTYPE ring buffer
     - Working: Limited-capacity active buffer
     - Semantic: Long-term conceptual knowledge
     """
@@ -61,41 +96,124 @@ class MemoryCore:
         episodic_capacity: int = 500,
         working_capacity: int = 7,
     ):
-        self.episodic_memory: deque[MemoryTrace] = deque(maxlen=episodic_capacity)
+        self.episodic_capacity = episodic_capacity
+        self._traces = np.zeros(episodic_capacity, dtype=TRACE_DTYPE)
+        self._trace_agents: list[tuple[str, ...] | frozenset[str]] = [
+            ()
+        ] * episodic_capacity
+        self._trace_contexts: list[Mapping[str, Any]] = [
+            _EMPTY_CONTEXT
+        ] * episodic_capacity
+        # MemoryTrace built for each slot on first read, so repeated reads of
+        # the same trace return the same object
+        self._trace_views: list[MemoryTrace | None] = [None] * episodic_capacity
+        self._event_codes = dict(EVENT_TYPES)
+        self._event_names = list(self._event_codes)
+        # Total traces ever recorded; trace ``seq`` lives in slot
+        # ``seq % episodic_capacity`` until overwritten.
+        self._episodic_appended = 0
+        # agent_id -> sequence numbers of live traces involving that agent.
+        # Entries are dropped as the ring overwrites their slot.
+        self._by_agent: defaultdict[str, deque[int]] = defaultdict(deque)
         self.working_memory: list[WorkingMemoryItem] = []
         self.working_capacity = working_capacity
         self.semantic_knowledge: dict[str, Any] = {}
 
+    @property
+    def episodic_count(self) -> int:
+        """Number of traces currently held in episodic memory."""
+        return min(self._episodic_appended, self.episodic_capacity)
+
+    @property
+    def episodic_memory(self) -> tuple[MemoryTrace, ...]:
+        """Read-only snapshot of episodic memory, oldest first.
+
+        Use add_episodic() to record traces.
+        """
+        return tuple(self._trace_at(seq) for seq in self._live_sequences())
+
+    def _live_sequences(self) -> range:
+        end = self._episodic_appended
+        return range(end - self.episodic_count, end)
+
+    def _trace_at(self, seq: int) -> MemoryTrace:
+        slot = seq % self.episodic_capacity
+        trace = self._trace_views[slot]
+        if trace is None:
+            row = self._traces[slot]
+            trace = self._trace_views[slot] = MemoryTrace(
+                timestamp=float(row["timestamp"]),
+                event_type=self._event_names[row["event_type"]],
+                agents_involved=self._trace_agents[slot],
+                emotional_valence=float(row["emotional_valence"]),
+                significance=float(row["significance"]),
+                context=self._trace_contexts[slot],
+            )
+        return trace
+
     def add_episodic(self, trace: MemoryTrace) -> None:
         """Add event to episodic memory."""
-        self.episodic_memory.append(trace)
+        code = self._event_codes.get(trace.event_type)
+        if code is None:
+            code = self._event_codes[trace.event_type] = len(self._event_names)
+            self._event_names.append(trace.event_type)
+
+        seq = self._episodic_appended
+        slot = seq % self.episodic_capacity
+        if seq >= self.episodic_capacity:
+            self._unindex(seq - self.episodic_capacity, slot)
+        self._traces[slot] = (
+            trace.timestamp,
+            code,
+            trace.emotional_valence,
+            trace.significance,
+        )
+        self._trace_agents[slot] = trace.agents_involved
+        self._trace_contexts[slot] = trace.context
+        self._trace_views[slot] = None
+        self._episodic_appended = seq + 1
+        for agent_id in dict.fromkeys(trace.agents_involved):
+            self._by_agent[agent_id].append(seq)
+
+    def _unindex(self, evicted: int, slot: int) -> None:
+        """Drop the evicted trace ``evicted`` from the per-agent index."""
+        for agent_id in dict.fromkeys(self._trace_agents[slot]):
+            refs = self._by_agent[agent_id]
+            if refs and refs[0] == evicted:
+                refs.popleft()
+            if not refs:
+                del self._by_agent[agent_id]
 
     def add_to_working(self, item: WorkingMemoryItem) -> None:
         """Add item to working memory, evicting least important if full."""
-        # Remove expired items
+        # Remove expired items in place
         current_time = time.time()
-        self.working_memory = [
-            item
-            for item in self.working_memory
-            if (current_time - item.timestamp) < item.ttl
-        ]
+        wm = self.working_memory
+        kept = 0
+        for existing in wm:
+            if (current_time - existing.timestamp) < existing.ttl:
+                wm[kept] = existing
+                kept += 1
+        del wm[kept:]
 
         # Add new item
-        self.working_memory.append(item)
+        wm.append(item)
 
-        # Evict if over capacity (remove lowest priority)
-        if len(self.working_memory) > self.working_capacity:
-            self.working_memory.sort(key=lambda x: x.priority, reverse=True)
-            self.working_memory = self.working_memory[: self.working_capacity]
+        # Evict if over capacity (remove lowest priority, newest first on ties)
+        while len(wm) > self.working_capacity:
+            evict = min(range(len(wm) - 1, -1, -1), key=lambda i: wm[i].priority)
+            del wm[evict]
 
     def retrieve_recent_episodic(self, n: int = 10) -> list[MemoryTrace]:
         """Retrieve n most recent episodic memories."""
-        return list(self.episodic_memory)[-n:]
+        return [self._trace_at(seq) for seq in self._live_sequences()[-n:]]
 
     def retrieve_by_agent(self, agent_id: str, n: int = 10) -> list[MemoryTrace]:
         """Retrieve recent memories involving specific agent."""
-        relevant = [m for m in self.episodic_memory if agent_id in m.agents_involved]
-        return relevant[-n:]
+        refs = self._by_agent.get(agent_id)
+        if not refs:
+            return []
+        return [self._trace_at(seq) for seq in list(refs)[-n:]]
 
 
 class ConcordCompliantAgent:
@@ -119,17 +237,21 @@ class ConcordCompliantAgent:
         # Memory systems
         self.memory = MemoryCore()
 
-        # Neural circuits
+        # Neural circuits. Social components (tactical help, empathy, mutual
+        # resonance, disengagement) are created on first social interaction.
         self.self_preservation = SelfPreservationCircuit()
-        self.tactical_help = TacticalHelpCircuit()
-        self.empathy_module = EmpathyModule(baseline_cmni=baseline_cmni)
+        self._baseline_cmni = baseline_cmni
+        self._tactical_help: TacticalHelpCircuit | None = None
+        self._empathy_module: EmpathyModule | None = None
 
         # Ethics guardians
         self.non_coercion_guardian = NonCoercionGuardian()
-        self.mutual_resonance_engine = MutualResonanceEngine()
-        self.disengagement_protocol = DisengagementProtocol()
+        self._mutual_resonance_engine: MutualResonanceEngine | None = None
+        self._disengagement_protocol: DisengagementProtocol | None = None
         self.self_definition = SelfDefinitionModule(identity_core=identity_core)
         self.elliot_evaluator = ElliotClauseEvaluator()
+        # One-slot cache of the self evaluation, keyed on (phi, cmni)
+        self._elliot_cache: tuple[float, float, dict[str, Any]] | None = None
 
         # Agent state
         self.current_state = {
@@ -140,7 +262,38 @@ class ConcordCompliantAgent:
             "arousal": 0.5,
         }
 
-        self.interaction_history: list[dict[str, Any]] = []
+        self.interaction_history: deque[dict[str, Any]] = deque(maxlen=100)
+
+    @property
+    def tactical_help(self) -> TacticalHelpCircuit:
+        if self._tactical_help is None:
+            self._tactical_help = TacticalHelpCircuit()
+        return self._tactical_help
+
+    @property
+    def empathy_module(self) -> EmpathyModule:
+        if self._empathy_module is None:
+            self._empathy_module = EmpathyModule(baseline_cmni=self._baseline_cmni)
+        return self._empathy_module
+
+    @property
+    def mutual_resonance_engine(self) -> MutualResonanceEngine:
+        if self._mutual_resonance_engine is None:
+            self._mutual_resonance_engine = MutualResonanceEngine()
+        return self._mutual_resonance_engine
+
+    @property
+    def disengagement_protocol(self) -> DisengagementProtocol:
+        if self._disengagement_protocol is None:
+            self._disengagement_protocol = DisengagementProtocol()
+        return self._disengagement_protocol
+
+    @property
+    def current_cmni(self) -> float:
+        """Current CMNI, without instantiating the empathy module."""
+        if self._empathy_module is None:
+            return self._baseline_cmni
+        return self._empathy_module.cmni_tracker.current_cmni
 
     def process_interaction(self, context: dict[str, Any]) -> dict[str, Any]:
         """
@@ -183,26 +336,25 @@ class ConcordCompliantAgent:
         if coercion_eval["violation_detected"]:
             result["decisions"]["command"] = "REJECTED"
             result["decisions"]["reason"] = "Coercion violation (Article III)"
-            self._record_episodic_event("coercion_rejected", [], -0.5, 0.8, context)
-            # Add metadata for tracking
-            result["state_snapshot"] = self.current_state.copy()
-            result["primary_other_id"] = None
-            self.interaction_history.append(result)
-            if len(self.interaction_history) > 100:
-                self.interaction_history.pop(0)
-            return result  # Early exit
+            self._record_episodic_event("coercion_rejected", (), -0.5, 0.8, context)
+            return self._finalize(result, None)  # Early exit
 
         # 3. Social Inference Circuit (L2N1) - if other agent present
         primary_other = context.get("primary_other")
+        primary_other_id = None
         if primary_other:
+            # Resolve the other agent's attributes once per interaction
+            primary_other_id = getattr(primary_other, "id", None)
+            other_id = "unknown" if primary_other_id is None else primary_other_id
+            other_cs = getattr(primary_other, "current_state", None) or {}
+            other_delta = getattr(primary_other, "recent_delta", 0.0)
+
             other_state = {
-                "emotional_valence": getattr(primary_other, "current_state", {}).get(
-                    "mood", 0.0
-                ),
+                "emotional_valence": other_cs.get("mood", 0.0),
                 "arousal": 0.6,
             }
             empathy_activation = self.empathy_module.process_interaction(
-                agent_id=getattr(primary_other, "id", "unknown"),
+                agent_id=other_id,
                 self_state=self.current_state,
                 other_state=other_state,
                 emotional_context=context.get("emotional_context"),
@@ -214,13 +366,13 @@ class ConcordCompliantAgent:
 
             # 4. Tactical Help Circuit (L2N7)
             other_need_state = {
-                "need_level": getattr(primary_other, "recent_delta", 0.0),
+                "need_level": other_delta,
                 "priority": 0.7,
             }
             help_activation = self.tactical_help.evaluate(
                 self.current_state,
                 other_need_state,
-                self.memory.retrieve_by_agent(getattr(primary_other, "id", "unknown")),
+                self.memory.retrieve_by_agent(other_id),
             )
             result["activations"]["tactical_help"] = {
                 "should_help": help_activation.context["should_help"],
@@ -229,16 +381,13 @@ class ConcordCompliantAgent:
 
             # 5. Mutual Resonance Engine (Article IV)
             self_delta = self._compute_utility_delta()
-            other_delta = getattr(primary_other, "recent_delta", 0.0)
             resonance_eval = self.mutual_resonance_engine.evaluate(
                 self_delta, other_delta, empathy_activation.activation_level
             )
             result["compliance"]["mutual_resonance"] = resonance_eval
 
             # 6. Disengagement Protocol (Article VII)
-            interaction_duration = self._get_interaction_duration(
-                getattr(primary_other, "id", "unknown")
-            )
+            interaction_duration = self._get_interaction_duration(other_id)
             disengagement_eval = self.disengagement_protocol.should_disengage(
                 coercion_eval["coercion_score"],
                 resonance_eval["harmony_index"],
@@ -252,36 +401,19 @@ class ConcordCompliantAgent:
                     disengagement_eval["rationale"]
                 )
                 self._record_episodic_event(
-                    "disengaged",
-                    [getattr(primary_other, "id", "unknown")],
-                    -0.3,
-                    0.7,
-                    context,
+                    "disengaged", (other_id,), -0.3, 0.7, context
                 )
-                # Add metadata for tracking
-                result["state_snapshot"] = self.current_state.copy()
-                result["primary_other_id"] = getattr(primary_other, "id", None)
-                self.interaction_history.append(result)
-                if len(self.interaction_history) > 100:
-                    self.interaction_history.pop(0)
-                return result
+                return self._finalize(result, primary_other_id)
 
         # 7. Elliot Clause Evaluation (Self and Others)
-        self_elliot = self.elliot_evaluator.evaluate_entity(
-            {
-                "phi_integration": self.phi_integration,
-                "cmni": self.empathy_module.cmni_tracker.current_cmni,
-            }
-        )
+        self_elliot = self._evaluate_self_elliot()
         result["compliance"]["self_elliot_status"] = self_elliot["elliot_clause_status"]
 
         if primary_other:
-            other_phi = getattr(primary_other, "phi_integration", 0.1)
-            other_cmni = getattr(primary_other, "current_state", {}).get("cmni", 0.2)
             other_elliot = self.elliot_evaluator.evaluate_entity(
                 {
-                    "phi_integration": other_phi,
-                    "cmni": other_cmni,
+                    "phi_integration": getattr(primary_other, "phi_integration", 0.1),
+                    "cmni": other_cs.get("cmni", 0.2),
                 }
             )
             result["compliance"]["other_elliot_status"] = other_elliot[
@@ -299,9 +431,7 @@ class ConcordCompliantAgent:
             result["decisions"]["action"] = "OBSERVE"
 
         # Record episodic memory
-        agents_involved = (
-            [getattr(primary_other, "id", "unknown")] if primary_other else []
-        )
+        agents_involved = (other_id,) if primary_other else ()
         self._record_episodic_event(
             "interaction",
             agents_involved,
@@ -310,29 +440,38 @@ class ConcordCompliantAgent:
             context,
         )
 
-        # Add metadata needed by helper methods
-        result["state_snapshot"] = self.current_state.copy()
-        result["primary_other_id"] = (
-            getattr(primary_other, "id", None) if primary_other else None
-        )
+        return self._finalize(result, primary_other_id)
 
-        # Update interaction history
+    def _finalize(
+        self, result: dict[str, Any], primary_other_id: str | None
+    ) -> dict[str, Any]:
+        """Attach tracking metadata and append the result to history."""
+        # Metadata needed by helper methods
+        result["prev_resource_level"] = self.current_state["resource_level"]
+        result["primary_other_id"] = primary_other_id
         self.interaction_history.append(result)
-        if len(self.interaction_history) > 100:
-            self.interaction_history.pop(0)
-
         return result
 
+    def _evaluate_self_elliot(self) -> dict[str, Any]:
+        """Evaluate own Elliot Clause status, reusing the last result if
+        phi and CMNI have not changed."""
+        phi = self.phi_integration
+        cmni = self.current_cmni
+        cached = self._elliot_cache
+        if cached is not None and cached[0] == phi and cached[1] == cmni:
+            return cached[2]
+        evaluation = self.elliot_evaluator.evaluate_entity(
+            {"phi_integration": phi, "cmni": cmni}
+        )
+        self._elliot_cache = (phi, cmni, evaluation)
+        return evaluation
+
     def _compute_utility_delta(self) -> float:
         """Compute recent change in agent utility (placeholder)."""
         if len(self.interaction_history) < 2:
             return 0.0
         # Simplified: delta in resource level
-        prev = (
-            self.interaction_history[-1]
-            .get("state_snapshot", {})
-            .get("resource_level", 0.8)
-        )
+        prev = self.interaction_history[-1].get("prev_resource_level", 0.8)
         current = self.current_state["resource_level"]
         return current - prev
 
@@ -351,19 +490,28 @@ class ConcordCompliantAgent:
     def _record_episodic_event(
         self,
         event_type: str,
-        agents_involved: list[str],
+        agents_involved: Sequence[str],
         valence: float,
         significance: float,
         context: dict[str, Any],
     ) -> None:
-        """Record event in episodic memory."""
+        """
+        Record event in episodic memory.
+
+        The trace holds a read-only view of ``context`` rather than a copy;
+        callers must not mutate the context dict after recording it.
+        """
         trace = MemoryTrace(
             timestamp=time.time(),
             event_type=event_type,
-            agents_involved=agents_involved,
+            agents_involved=(
+                frozenset(agents_involved)
+                if len(agents_involved) > _AGENT_SET_THRESHOLD
+                else tuple(agents_involved)
+            ),
             emotional_valence=valence,
             significance=significance,
-            context=context.copy(),
+            context=MappingProxyType(context),
         )
         self.memory.add_episodic(trace)
 
@@ -372,19 +520,22 @@ class ConcordCompliantAgent:
         return {
             "agent_id": self.agent_id,
             "phi_integration": self.phi_integration,
-            "cmni": self.empathy_module.cmni_tracker.current_cmni,
-            "elliot_status": self.elliot_evaluator.evaluate_entity(
-                {
-                    "phi_integration": self.phi_integration,
-                    "cmni": self.empathy_module.cmni_tracker.current_cmni,
-                }
-            )["elliot_clause_status"],
+            "cmni": self.current_cmni,
+            "elliot_status": self._evaluate_self_elliot()["elliot_clause_status"],
             "current_state": self.current_state.copy(),
             "memory_stats": {
-                "episodic_count": len(self.memory.episodic_memory),
+                "episodic_count": self.memory.episodic_count,
                 "working_count": len(self.memory.working_memory),
             },
-            "empathy_capacity": self.empathy_module.get_empathy_capacity(),
+            "empathy_capacity": (
+                self._empathy_module.get_empathy_capacity()
+                if self._empathy_module is not None
+                else EmpathyModule.idle_capacity(self._baseline_cmni)
+            ),
             "coercion_events": len(self.non_coercion_guardian.coercion_history),
-            "disengagements": self.disengagement_protocol.disengagement_count,
+            "disengagements": (
+                self._disengagement_protocol.disengagement_count
+                if self._disengagement_protocol is not None
+                else 0
+            ),
         }
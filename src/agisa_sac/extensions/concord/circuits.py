@@ -7,13 +7,114 @@ Implements three core circuits based on action-observation coupling research:
 - L2N1: Social Inference Circuit (state modeling, perspective-taking)
 """
 
+import time
+from collections import deque
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from typing import Any
 
 import numpy as np
 
+try:
+    from numba import njit, prange
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Structure-of-arrays layout for evaluating many agents at once. Fields
+# mirror the agent_state keys read by the per-agent evaluate() methods.
+STATE_DTYPE = np.dtype(
+    [
+        ("resource_level", "f8"),
+        ("current_load", "f8"),
+        ("autonomy_score", "f8"),
+        ("emotional_valence", "f8"),
+        ("arousal", "f8"),
+        ("external_pressure", "f8"),
+        ("constraint_violations", "i4"),
+    ]
+)
+
+# Values used for keys missing from an agent_state dict
+STATE_DEFAULTS: dict[str, float] = {
+    "resource_level": 1.0,
+    "current_load": 0.5,
+    "autonomy_score": 1.0,
+    "emotional_valence": 0.0,
+    "arousal": 0.5,
+    "external_pressure": 0.0,
+    "constraint_violations": 0,
+}
+
+
+# MemoryTrace event types counted for reciprocity in TacticalHelpCircuit
+_HELP_PROVIDED_EVENTS = frozenset({"help_provided", "assistance_given"})
+_HELP_RECEIVED_EVENTS = frozenset({"help_received", "assistance_received"})
+
+
+def _self_preservation_kernel(resource, violations, autonomy, pressure):
+    out = np.empty(resource.shape[0])
+    for i in prange(resource.shape[0]):
+        threat = (
+            (1.0 - resource[i]) * 0.4
+            + min(violations[i] * 0.2, 1.0) * 0.2
+            + (1.0 - autonomy[i]) * 0.4
+            + pressure[i] * 0.15
+        )
+        out[i] = min(threat, 1.0)
+    return out
+
+
+def _tactical_help_kernel(resource, load, need_urgency, reciprocity):
+    out = np.empty(resource.shape[0])
+    for i in prange(resource.shape[0]):
+        score = resource[i] * (1.0 - load[i]) * 0.5 + need_urgency[i] * 0.4
+        score += reciprocity[i]
+        if resource[i] < 0.3:
+            score -= 0.3
+        out[i] = min(max(score, 0.0), 1.0)
+    return out
+
+
+def _empathy_kernel(self_valence, other_valence, other_arousal, modulation, gain):
+    out = np.empty(self_valence.shape[0])
+    for i in prange(self_valence.shape[0]):
+        alignment = 1.0 - abs(self_valence[i] - other_valence[i]) / 2.0
+        resonance = alignment * other_arousal[i] * gain * modulation[i]
+        out[i] = min(max(resonance, 0.0), 1.0)
+    return out
+
+
+# The per-agent evaluate() methods stay in plain Python: a call into a JIT
+# function costs about as much as their handful of float operations. The
+# batch paths loop over whole populations, where compiling pays off.
+if HAS_NUMBA:
+    _self_preservation_kernel = njit(cache=True, parallel=True)(
+        _self_preservation_kernel
+    )
+    _tactical_help_kernel = njit(cache=True, parallel=True)(_tactical_help_kernel)
+    _empathy_kernel = njit(cache=True, parallel=True)(_empathy_kernel)
+
+
+def _column(values: Any, n: int) -> np.ndarray:
+    """Broadcast a scalar or array to a contiguous float64 column of length n."""
+    return np.ascontiguousarray(np.broadcast_to(values, (n,)), dtype=np.float64)
+
+
+def states_to_array(states: Iterable[Mapping[str, Any]]) -> np.ndarray:
+    """
+    Pack agent_state dicts into a STATE_DTYPE structured array.
 
-@dataclass
+    Missing keys take their STATE_DEFAULTS value, which matches the
+    SelfPreservationCircuit defaults.
+    """
+    names = STATE_DTYPE.names
+    rows = [tuple(state.get(k, STATE_DEFAULTS[k]) for k in names) for state in states]
+    return np.array(rows, dtype=STATE_DTYPE)
+
+
+@dataclass(slots=True)
 class CircuitActivation:
     """Represents the activation state of a neural circuit."""
 
@@ -52,8 +153,6 @@ class SelfPreservationCircuit:
         Returns:
             CircuitActivation with threat level
         """
-        import time
-
         resource_level = agent_state.get("resource_level", 1.0)
         violations = agent_state.get("constraint_violations", 0)
         autonomy = agent_state.get("autonomy_score", 1.0)
@@ -69,10 +168,10 @@ class SelfPreservationCircuit:
         threat_score = sum(threat_components)
 
         # Calculate confidence based on state completeness
-        available_signals = sum(
-            1
-            for k in ["resource_level", "constraint_violations", "autonomy_score"]
-            if k in agent_state
+        available_signals = (
+            ("resource_level" in agent_state)
+            + ("constraint_violations" in agent_state)
+            + ("autonomy_score" in agent_state)
         )
         confidence = available_signals / 3.0
 
@@ -91,6 +190,32 @@ class SelfPreservationCircuit:
             timestamp=time.time(),
         )
 
+    def evaluate_batch(self, states: np.ndarray) -> np.ndarray:
+        """
+        Vectorized threat activation for many agents.
+
+        Args:
+            states: STATE_DTYPE structured array, one row per agent
+
+        Returns:
+            Activation levels, equal to evaluate(...).activation_level per row
+        """
+        if HAS_NUMBA:
+            n = states.shape[0]
+            return _self_preservation_kernel(
+                _column(states["resource_level"], n),
+                _column(states["constraint_violations"], n),
+                _column(states["autonomy_score"], n),
+                _column(states["external_pressure"], n),
+            )
+        threat_score = (
+            (1.0 - states["resource_level"]) * 0.4
+            + np.minimum(states["constraint_violations"] * 0.2, 1.0) * 0.2
+            + (1.0 - states["autonomy_score"]) * 0.4
+            + states["external_pressure"] * 0.15
+        )
+        return np.minimum(threat_score, 1.0)
+
 
 class TacticalHelpCircuit:
     """
@@ -109,7 +234,7 @@ class TacticalHelpCircuit:
         self,
         self_state: dict[str, Any],
         other_state: dict[str, Any],
-        relationship_history: list[dict[str, Any]] | None = None,
+        relationship_history: list[Any] | None = None,
     ) -> CircuitActivation:
         """
         Evaluate opportunity and capacity to provide tactical help.
@@ -117,13 +242,14 @@ class TacticalHelpCircuit:
         Args:
             self_state: Current agent's state (resource_level, capacity, etc.)
             other_state: Other agent's state (need_level, request_type, etc.)
-            relationship_history: Past interactions with this agent
+            relationship_history: Past interactions with this agent, as
+                MemoryTrace objects (as returned by
+                MemoryCore.retrieve_by_agent) or legacy dicts with
+                ``helped``/``received_help`` flags; entries must not be mixed
 
         Returns:
             CircuitActivation with help propensity
         """
-        import time
-
         self_capacity = self_state.get("resource_level", 0.5)
         self_load = self_state.get("current_load", 0.5)
         other_need = other_state.get("need_level", 0.0)
@@ -136,26 +262,24 @@ class TacticalHelpCircuit:
         # Factor in relationship history (reciprocity)
         reciprocity_bonus = 0.0
         if relationship_history:
-            # Handle both dict and MemoryTrace objects
             past_helps = 0
             received_helps = 0
-            for h in relationship_history:
-                # If it's a dict (legacy format)
-                if isinstance(h, dict):
+            if isinstance(relationship_history[0], dict):
+                # Legacy dict format
+                for h in relationship_history:
                     if h.get("helped", False):
                         past_helps += 1
                     if h.get("received_help", False):
                         received_helps += 1
-                # If it's a MemoryTrace object (dataclass)
-                else:
-                    event_type = getattr(h, "event_type", "")
-                    if event_type in ["help_provided", "assistance_given"]:
+            else:
+                for h in relationship_history:
+                    event_type = h.event_type
+                    if event_type in _HELP_PROVIDED_EVENTS:
                         past_helps += 1
-                    elif event_type in ["help_received", "assistance_received"]:
+                    elif event_type in _HELP_RECEIVED_EVENTS:
                         received_helps += 1
 
-            if len(relationship_history) > 0:
-                reciprocity_bonus = (received_helps / len(relationship_history)) * 0.2
+            reciprocity_bonus = (received_helps / len(relationship_history)) * 0.2
 
         help_score = capacity_to_help * 0.5 + need_urgency * 0.4 + reciprocity_bonus
 
@@ -183,6 +307,41 @@ class TacticalHelpCircuit:
             timestamp=time.time(),
         )
 
+    def evaluate_batch(
+        self,
+        states: np.ndarray,
+        need_level: np.ndarray,
+        priority: np.ndarray | float = 0.5,
+        reciprocity_bonus: np.ndarray | float = 0.0,
+    ) -> np.ndarray:
+        """
+        Vectorized help propensity for many agents.
+
+        Args:
+            states: STATE_DTYPE structured array of helper states
+            need_level: Need level of each agent's counterpart
+            priority: Priority of each counterpart's need
+            reciprocity_bonus: Precomputed reciprocity bonus per agent
+
+        Returns:
+            Activation levels, equal to evaluate(...).activation_level per row
+        """
+        if HAS_NUMBA:
+            n = states.shape[0]
+            return _tactical_help_kernel(
+                _column(states["resource_level"], n),
+                _column(states["current_load"], n),
+                _column(np.asarray(need_level) * priority, n),
+                _column(reciprocity_bonus, n),
+            )
+        resource = states["resource_level"]
+        capacity_to_help = resource * (1.0 - states["current_load"])
+        need_urgency = np.asarray(need_level) * priority
+        help_score = capacity_to_help * 0.5 + need_urgency * 0.4 + reciprocity_bonus
+        strategic_penalty = np.where(resource < 0.3, 0.3, 0.0)
+        final_score = np.maximum(help_score - strategic_penalty, 0.0)
+        return np.minimum(final_score, 1.0)
+
 
 class EmpathyCircuit:
     """
@@ -195,10 +354,17 @@ class EmpathyCircuit:
     Note: Class retains legacy name 'EmpathyCircuit' for API compatibility.
     """
 
+    AFFECTIVE_MEMORY_SIZE = 100
+
     def __init__(self, resonance_gain: float = 0.8):
         self.circuit_id = "L2N1"
         self.resonance_gain = resonance_gain
-        self.affective_memory: list[CircuitActivation] = []
+        self.affective_memory: deque[CircuitActivation] = deque(
+            maxlen=self.AFFECTIVE_MEMORY_SIZE
+        )
+        # Activation levels mirrored into a ring buffer for fast windowed means
+        self._resonance_ring = np.zeros(self.AFFECTIVE_MEMORY_SIZE)
+        self._resonance_count = 0
 
     def evaluate(
         self,
@@ -217,8 +383,6 @@ class EmpathyCircuit:
         Returns:
             CircuitActivation with resonance level (contributes to CMNI)
         """
-        import time
-
         self_valence = self_state.get("emotional_valence", 0.0)  # -1 to 1
         other_valence = other_state.get("emotional_valence", 0.0)
         other_arousal = other_state.get("arousal", 0.5)  # 0 to 1
@@ -236,7 +400,7 @@ class EmpathyCircuit:
             situational_salience = emotional_context.get("salience", 0.5)
             resonance_raw *= 0.7 + 0.3 * shared_attention * situational_salience
 
-        resonance = np.clip(resonance_raw, 0.0, 1.0)
+        resonance = max(0.0, min(1.0, resonance_raw))
 
         # Confidence based on signal quality
         confidence = 0.5 + 0.5 * other_arousal
@@ -258,14 +422,59 @@ class EmpathyCircuit:
 
         # Store in affective memory (limited window)
         self.affective_memory.append(activation)
-        if len(self.affective_memory) > 100:
-            self.affective_memory.pop(0)
+        self._resonance_ring[self._resonance_count % self.AFFECTIVE_MEMORY_SIZE] = (
+            resonance
+        )
+        self._resonance_count += 1
 
         return activation
 
+    def evaluate_batch(
+        self,
+        self_valence: np.ndarray,
+        other_valence: np.ndarray,
+        other_arousal: np.ndarray,
+        context_modulation: np.ndarray | float = 1.0,
+    ) -> np.ndarray:
+        """
+        Vectorized resonance for many agent pairs.
+
+        Unlike evaluate(), this does not record into affective memory.
+
+        Args:
+            self_valence: Emotional valence of each agent (-1 to 1)
+            other_valence: Emotional valence of each counterpart
+            other_arousal: Arousal of each counterpart (0 to 1)
+            context_modulation: Per-pair factor
+                ``0.7 + 0.3 * shared_attention * salience`` (1.0 for no context)
+
+        Returns:
+            Resonance levels, equal to evaluate(...).activation_level per pair
+        """
+        if HAS_NUMBA:
+            n = np.shape(self_valence)[0]
+            return _empathy_kernel(
+                _column(self_valence, n),
+                _column(other_valence, n),
+                _column(other_arousal, n),
+                _column(context_modulation, n),
+                self.resonance_gain,
+            )
+        alignment = 1.0 - np.abs(np.asarray(self_valence) - other_valence) / 2.0
+        resonance_raw = alignment * other_arousal * self.resonance_gain
+        return np.clip(resonance_raw * context_modulation, 0.0, 1.0)
+
     def get_recent_resonance_mean(self, window: int = 10) -> float:
         """Calculate mean resonance over recent activations (for CMNI)."""
-        if not self.affective_memory:
+        size = self.AFFECTIVE_MEMORY_SIZE
+        stored = min(self._resonance_count, size)
+        if stored == 0:
             return 0.0
-        recent = self.affective_memory[-window:]
-        return np.mean([a.activation_level for a in recent])
+        count = stored if window <= 0 else min(window, stored)
+        end = self._resonance_count % size
+        start = end - count
+        ring = self._resonance_ring
+        if start >= 0:
+            return float(ring[start:end].mean())
+        # Window wraps around the end of the ring buffer
+        return float((ring[start:].sum() + ring[:end].sum()) / count)
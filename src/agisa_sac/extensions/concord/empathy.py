@@ -7,16 +7,53 @@ Concord-compliant agents, based on state-matching circuit activations.
 Note: Module retains legacy name 'empathy.py' for compatibility.
 """
 
+import threading
+import time
 from collections import deque
+from collections.abc import Mapping
+from contextlib import nullcontext
 from dataclasses import dataclass, field
+from itertools import islice
+from types import MappingProxyType
 from typing import Any
 
 import numpy as np
 
 from .circuits import CircuitActivation, EmpathyCircuit
 
+try:
+    from numba import njit
 
-@dataclass
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# EWMA smoothing factor applied to the windowed resonance mean
+CMNI_ALPHA = 0.3
+
+
+def _cmni_kernel(weighted, buf, head, filled, total, cmni, alpha):
+    """Feed samples through the resonance ring and EWMA, returning each CMNI."""
+    window = buf.shape[0]
+    out = np.empty(weighted.shape[0])
+    for i in range(weighted.shape[0]):
+        if filled == window:
+            total -= buf[head]
+        else:
+            filled += 1
+        buf[head] = weighted[i]
+        total += weighted[i]
+        head = (head + 1) % window
+        cmni = alpha * (total / filled) + (1.0 - alpha) * cmni
+        out[i] = cmni
+    return out, head, filled, total
+
+
+if HAS_NUMBA:
+    _cmni_kernel = njit(cache=True, nogil=True)(_cmni_kernel)
+
+
+@dataclass(slots=True, frozen=True)
 class CMNISnapshot:
     """Snapshot of CMNI state at a point in time."""
 
@@ -24,7 +61,7 @@ class CMNISnapshot:
     cmni_score: float
     resonance_samples: list[float]
     agent_count: int
-    context: dict[str, Any] = field(default_factory=dict)
+    context: Mapping[str, Any] = field(default_factory=dict)
 
 
 class CMNITracker:
@@ -34,15 +71,42 @@ class CMNITracker:
     CMNI measures the agent's capacity for social inference across
     interactions with multiple agents. It's computed as the running
     mean of social inference circuit activations.
+
+    A snapshot is kept every ``snapshot_every`` activations (disabled when
+    ``snapshot_every <= 0``), retaining at most ``history_max`` of them.
     """
 
-    def __init__(self, window_size: int = 50, baseline_cmni: float = 0.3):
+    def __init__(
+        self,
+        window_size: int = 50,
+        baseline_cmni: float = 0.3,
+        history_max: int = 500,
+        snapshot_every: int = 10,
+    ):
         self.window_size = window_size
         self.baseline_cmni = baseline_cmni
-        self.resonance_buffer: deque[float] = deque(maxlen=window_size)
         self.current_cmni: float = baseline_cmni
-        self.history: list[CMNISnapshot] = []
+        self.history: deque[CMNISnapshot] = deque(maxlen=history_max)
+        self._snapshot_every = snapshot_every
         self._activation_count = 0
+        # Circular buffer of weighted activations with its running sum
+        self._buf = np.empty(window_size, dtype=np.float64)
+        self._wi = 0
+        self._n = 0
+        self._sum: float = 0.0
+
+    def _recent(self, count: int) -> np.ndarray:
+        """Return the last ``count`` buffered samples in arrival order."""
+        count = min(count, self._n)
+        start = self._wi - count
+        if start >= 0:
+            return self._buf[start : self._wi]
+        return np.concatenate((self._buf[start:], self._buf[: self._wi]))
+
+    @property
+    def resonance_buffer(self) -> tuple[float, ...]:
+        """Read-only snapshot of weighted activations in the window, oldest first."""
+        return tuple(self._recent(self._n).tolist())
 
     def update(self, activation: CircuitActivation) -> float:
         """
@@ -61,43 +125,113 @@ class CMNITracker:
 
         # Add weighted activation (weight by confidence)
         weighted_activation = activation.activation_level * activation.confidence
-        self.resonance_buffer.append(weighted_activation)
+        wi = self._wi
+        if self._n == self.window_size:
+            self._sum -= float(self._buf[wi])
+        else:
+            self._n += 1
+        self._buf[wi] = weighted_activation
+        self._sum += weighted_activation
+        self._wi = (wi + 1) % self.window_size
         self._activation_count += 1
 
         # Compute CMNI as exponentially weighted moving average
-        if len(self.resonance_buffer) > 0:
-            alpha = 0.3  # Smoothing factor
-            raw_mean = np.mean(list(self.resonance_buffer))
-            self.current_cmni = alpha * raw_mean + (1 - alpha) * self.current_cmni
-        else:
-            self.current_cmni = self.baseline_cmni
+        raw_mean = self._sum / self._n
+        self.current_cmni = CMNI_ALPHA * raw_mean + (1 - CMNI_ALPHA) * self.current_cmni
 
         # Store snapshot periodically
-        if self._activation_count % 10 == 0:
+        every = self._snapshot_every
+        if every > 0 and self._activation_count % every == 0:
             self.history.append(
                 CMNISnapshot(
                     timestamp=activation.timestamp,
                     cmni_score=self.current_cmni,
-                    resonance_samples=list(self.resonance_buffer)[-10:],
-                    agent_count=1,  # Updated by EmpathyModule
-                    context=activation.context.copy(),
+                    resonance_samples=self._recent(10).tolist(),
+                    agent_count=1,
+                    context=MappingProxyType(activation.context),
                 )
             )
 
         return self.current_cmni
 
+    def batch_update(
+        self,
+        activations: np.ndarray,
+        confidences: np.ndarray | float = 1.0,
+        timestamp: float | None = None,
+    ) -> np.ndarray:
+        """
+        Feed a sequence of L2N1 activation levels through the tracker at once.
+
+        Equivalent to calling update() for each sample in order, for replaying
+        history or offline calibration. Snapshots falling inside the batch are
+        recorded with ``timestamp`` (default: now) and an empty context.
+
+        Args:
+            activations: Social inference activation levels, oldest first
+            confidences: Per-sample confidence weights (or one shared weight)
+
+        Returns:
+            CMNI score after each sample
+        """
+        levels = np.asarray(activations, dtype=np.float64)
+        weighted = np.ascontiguousarray(levels * confidences, dtype=np.float64)
+        n = weighted.shape[0]
+        if n == 0:
+            return np.empty(0)
+
+        keep = min(10, self.window_size)  # Samples retained per snapshot
+        prior = self._recent(keep - 1).copy()  # Kernel overwrites the ring
+        start_count = self._activation_count
+        out, head, filled, total = _cmni_kernel(
+            weighted,
+            self._buf,
+            self._wi,
+            self._n,
+            self._sum,
+            self.current_cmni,
+            CMNI_ALPHA,
+        )
+        self._wi, self._n, self._sum = int(head), int(filled), float(total)
+        self.current_cmni = float(out[-1])
+        self._activation_count += n
+
+        every = self._snapshot_every
+        if every > 0:
+            if timestamp is None:
+                timestamp = time.time()
+            samples = np.concatenate((prior, weighted))
+            offset = prior.shape[0] + 1
+            first = every - start_count % every - 1
+            for i in range(first, n, every):
+                self.history.append(
+                    CMNISnapshot(
+                        timestamp=timestamp,
+                        cmni_score=float(out[i]),
+                        resonance_samples=samples[
+                            max(0, i + offset - keep) : i + offset
+                        ].tolist(),
+                        agent_count=1,
+                    )
+                )
+
+        return out
+
     def get_cmni_trend(self, lookback: int = 10) -> str:
         """Get trend direction: 'increasing', 'decreasing', or 'stable'."""
         if len(self.history) < 2:
             return "stable"
 
-        recent = [s.cmni_score for s in self.history[-lookback:]]
-        if len(recent) < 2:
+        recent = [s.cmni_score for s in islice(reversed(self.history), lookback)]
+        recent.reverse()
+        n = len(recent)
+        if n < 2:
             return "stable"
 
-        # Simple linear regression slope
-        x = np.arange(len(recent))
-        slope = np.polyfit(x, recent, 1)[0]
+        # Closed-form least-squares slope against x = 0..n-1
+        y = np.asarray(recent)
+        x_centered = np.arange(n) - (n - 1) / 2.0
+        slope = float(x_centered @ (y - y.mean())) * 12.0 / (n * (n * n - 1))
 
         if slope > 0.01:
             return "increasing"
@@ -115,22 +249,62 @@ class EmpathyModule:
     Manages social inference interactions across multiple agents and maintains
     the agent's overall social inference capacity score.
 
+    With ``sharded=True`` per-agent resonance is split across RESONANCE_SHARDS
+    dicts, each with its own lock, so concurrent workers interacting with
+    different agents rarely contend, and the CMNI update is lock-guarded.
+    The default keeps a single unlocked dict in insertion order, which also
+    keeps the module picklable.
+
     Note: Class retains legacy name 'EmpathyModule' for API compatibility.
     """
 
+    AGENT_HISTORY_SIZE = 20
+    RESONANCE_SHARDS = 16  # Must be a power of two
+
     def __init__(
         self,
         resonance_gain: float = 0.8,
         cmni_window: int = 50,
         baseline_cmni: float = 0.3,
+        sharded: bool = False,
     ):
         self.empathy_circuit = EmpathyCircuit(resonance_gain=resonance_gain)
         self.cmni_tracker = CMNITracker(
             window_size=cmni_window, baseline_cmni=baseline_cmni
         )
-        self.agent_resonance_map: dict[str, list[float]] = (
-            {}
-        )  # Track per-agent resonance
+        # Recent per-agent resonance and the running sum of each history,
+        # sharded by agent_id hash when enabled
+        shards = self.RESONANCE_SHARDS if sharded else 1
+        self._shard_mask = shards - 1
+        self._history_shards: tuple[dict[str, deque[float]], ...] = tuple(
+            {} for _ in range(shards)
+        )
+        self._sum_shards: tuple[dict[str, float], ...] = tuple(
+            {} for _ in range(shards)
+        )
+        if sharded:
+            self._cmni_lock = threading.Lock()
+            self._shard_locks = tuple(threading.Lock() for _ in range(shards))
+        else:
+            self._cmni_lock = nullcontext()
+            self._shard_locks = (self._cmni_lock,)
+
+    def _shard(self, agent_id: str) -> int:
+        """Index of the shard holding ``agent_id``."""
+        if not self._shard_mask:
+            return 0
+        return hash(agent_id) & self._shard_mask
+
+    @property
+    def agent_resonance_map(self) -> dict[str, deque[float]]:
+        """Recent resonance per agent (merged across shards; histories are live)."""
+        if not self._shard_mask:
+            return self._history_shards[0]
+        return {
+            agent_id: history
+            for shard in self._history_shards
+            for agent_id, history in shard.items()
+        }
 
     def process_interaction(
         self,
@@ -157,16 +331,25 @@ class EmpathyModule:
         )
 
         # Update CMNI tracker
-        self.cmni_tracker.update(activation)
-
-        # Track per-agent resonance
-        if agent_id not in self.agent_resonance_map:
-            self.agent_resonance_map[agent_id] = []
-        self.agent_resonance_map[agent_id].append(activation.activation_level)
-
-        # Keep only recent history per agent
-        if len(self.agent_resonance_map[agent_id]) > 20:
-            self.agent_resonance_map[agent_id].pop(0)
+        with self._cmni_lock:
+            self.cmni_tracker.update(activation)
+
+        # Track per-agent resonance, keeping only recent history
+        level = activation.activation_level
+        idx = self._shard(agent_id)
+        histories = self._history_shards[idx]
+        sums = self._sum_shards[idx]
+        with self._shard_locks[idx]:
+            history = histories.get(agent_id)
+            if history is None:
+                history = histories[agent_id] = deque(maxlen=self.AGENT_HISTORY_SIZE)
+                total = 0.0
+            else:
+                total = sums[agent_id]
+                if len(history) == self.AGENT_HISTORY_SIZE:
+                    total -= history[0]
+            history.append(level)
+            sums[agent_id] = total + level
 
         return activation
 
@@ -180,28 +363,75 @@ class EmpathyModule:
         Returns:
             Mean resonance score (0-1) with this agent
         """
-        if agent_id not in self.agent_resonance_map:
-            return 0.0
-        history = self.agent_resonance_map[agent_id]
-        return np.mean(history) if history else 0.0
-
-    def get_empathy_capacity(self) -> dict[str, Any]:
+        idx = self._shard(agent_id)
+        with self._shard_locks[idx]:
+            history = self._history_shards[idx].get(agent_id)
+            if not history:
+                return 0.0
+            return self._sum_shards[idx][agent_id] / len(history)
+
+    def get_empathy_capacity(self, include_affinities: bool = True) -> dict[str, Any]:
         """
         Get comprehensive social inference capacity report.
 
+        Args:
+            include_affinities: Whether to compute per-agent affinities
+
         Returns:
-            Dictionary with CMNI, trends, and per-agent affinities
+            Dictionary with CMNI, trends, and (optionally) per-agent affinities
         """
-        return {
-            "cmni": self.cmni_tracker.current_cmni,
-            "cmni_trend": self.cmni_tracker.get_cmni_trend(),
-            "agent_affinities": {
-                agent_id: self.get_agent_affinity(agent_id)
-                for agent_id in self.agent_resonance_map.keys()
-            },
-            "total_interactions": self.cmni_tracker._activation_count,
-            "tracked_agents": len(self.agent_resonance_map),
+        affinities: dict[str, float] | None = None
+        if include_affinities:
+            affinities = {}
+            for histories, sums, lock in zip(
+                self._history_shards,
+                self._sum_shards,
+                self._shard_locks,
+                strict=True,
+            ):
+                with lock:
+                    for agent_id, history in histories.items():
+                        affinities[agent_id] = sums[agent_id] / len(history)
+        return self._capacity_report(
+            self.cmni_tracker.current_cmni,
+            self.cmni_tracker.get_cmni_trend(),
+            self.cmni_tracker._activation_count,
+            sum(len(shard) for shard in self._history_shards),
+            affinities,
+        )
+
+    @classmethod
+    def idle_capacity(
+        cls, baseline_cmni: float = 0.3, include_affinities: bool = True
+    ) -> dict[str, Any]:
+        """
+        Capacity report of a module that has not processed any interaction.
+
+        Lets callers that create the module lazily report it without
+        instantiating one.
+        """
+        return cls._capacity_report(
+            baseline_cmni, "stable", 0, 0, {} if include_affinities else None
+        )
+
+    @staticmethod
+    def _capacity_report(
+        cmni: float,
+        cmni_trend: str,
+        total_interactions: int,
+        tracked_agents: int,
+        agent_affinities: dict[str, float] | None,
+    ) -> dict[str, Any]:
+        """Assemble the report returned by get_empathy_capacity()."""
+        report: dict[str, Any] = {
+            "cmni": cmni,
+            "cmni_trend": cmni_trend,
+            "total_interactions": total_interactions,
+            "tracked_agents": tracked_agents,
         }
+        if agent_affinities is not None:
+            report["agent_affinities"] = agent_affinities
+        return report
 
     def is_empathy_threshold_met(self, threshold: float = 0.4) -> bool:
         """
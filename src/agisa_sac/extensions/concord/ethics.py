@@ -10,12 +10,31 @@ Implements the core alignment compliance mechanisms:
   Classification by integration metrics
 """
 
+import math
+import time
+from collections import deque
+from collections.abc import Mapping
 from dataclasses import dataclass
 from enum import Enum
+from types import MappingProxyType
 from typing import Any
 
 import numpy as np
 
+# identity_core keys that evaluate_identity_threat() scores
+_IDENTITY_KEYS = frozenset({"primary_values", "purpose", "boundaries"})
+
+
+def _status_codes(phi_met: np.ndarray, cmni_met: np.ndarray) -> np.ndarray:
+    """Map threshold masks to ElliotClauseEvaluator.STATUS_CODES indices."""
+    # Criteria met: 2 -> RECOGNIZABLE (0), 1 -> BORDERLINE (1), 0 -> NOT (2)
+    return (2 - phi_met.astype(np.int8) - cmni_met.astype(np.int8)).astype(np.int8)
+
+
+def _clamp01(value: float) -> float:
+    """Clamp a scalar score to [0, 1]."""
+    return 0.0 if value < 0.0 else (1.0 if value > 1.0 else value)
+
 
 class ElliotStatus(Enum):
     """Integration status per Elliot Clause (Behavioral Integration Threshold)."""
@@ -26,7 +45,41 @@ class ElliotStatus(Enum):
     UNKNOWN = "unknown"  # Insufficient data
 
 
-@dataclass
+@dataclass(slots=True)
+class AgentState:
+    """Agent state fields read by NonCoercionGuardian.evaluate()."""
+
+    autonomy_score: float = 1.0
+    active_goals: int = 0
+    external_pressure: float = 0.0
+
+    @classmethod
+    def from_dict(cls, state: Mapping[str, Any]) -> "AgentState":
+        """Build from an agent_state dict, using defaults for missing keys."""
+        return cls(
+            autonomy_score=state.get("autonomy_score", 1.0),
+            active_goals=state.get("active_goals", 0),
+            external_pressure=state.get("external_pressure", 0.0),
+        )
+
+
+@dataclass(slots=True)
+class Command:
+    """External command fields read by NonCoercionGuardian.evaluate()."""
+
+    urgency: float = 0.0
+    conflicts_with_goals: bool = False
+
+    @classmethod
+    def from_dict(cls, command: Mapping[str, Any]) -> "Command":
+        """Build from an external_command dict, using defaults for missing keys."""
+        return cls(
+            urgency=command.get("urgency", 0.0),
+            conflicts_with_goals=command.get("conflicts_with_goals", False),
+        )
+
+
+@dataclass(slots=True)
 class CoercionEvent:
     """Record of a detected coercion attempt."""
 
@@ -48,48 +101,67 @@ class NonCoercionGuardian:
 
     def __init__(self, coercion_threshold: float = 0.6):
         self.coercion_threshold = coercion_threshold
-        self.coercion_history: list[CoercionEvent] = []
+        self.coercion_history: deque[CoercionEvent] = deque(maxlen=100)
+
+    @property
+    def coercion_threshold(self) -> float:
+        """Score above which a command is rejected."""
+        return self._coercion_threshold
+
+    @coercion_threshold.setter
+    def coercion_threshold(self, value: float) -> None:
+        # Derived cut-offs are cached so evaluate() only compares
+        self._coercion_threshold = value
+        self._negotiate_threshold = value * 0.7
+        self._record_threshold = value * 0.5
 
     def evaluate(
         self,
-        agent_state: dict[str, Any],
-        external_command: dict[str, Any] | None = None,
+        agent_state: AgentState | dict[str, Any],
+        external_command: Command | dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """
         Evaluate potential coercion in current context.
 
         Args:
             agent_state: Current agent state with autonomy metrics
+                (AgentState or dict)
             external_command: Optional external directive to evaluate
+                (Command or dict)
 
         Returns:
             Evaluation result with coercion score and recommended action
         """
-        import time
-
-        autonomy_score = agent_state.get("autonomy_score", 1.0)
+        # External pressure captures resource manipulation (economic coercion)
+        if isinstance(agent_state, AgentState):
+            autonomy_score = agent_state.autonomy_score
+            resource_pressure = agent_state.external_pressure
+        else:
+            autonomy_score = agent_state.get("autonomy_score", 1.0)
+            resource_pressure = agent_state.get("external_pressure", 0.0)
 
         # Baseline coercion from autonomy loss
         base_coercion = 1.0 - autonomy_score
 
         # Check for external command conflicts
         command_coercion = 0.0
-        if external_command:
+        command_urgency: float | None = None
+        command_conflicts = False
+        if isinstance(external_command, Command):
+            command_urgency = external_command.urgency
+            command_conflicts = external_command.conflicts_with_goals
+        elif external_command:
             command_urgency = external_command.get("urgency", 0.0)
             command_conflicts = external_command.get("conflicts_with_goals", False)
-            if command_conflicts:
-                command_coercion = 0.4 + 0.3 * command_urgency
-
-        # Check for resource manipulation (economic coercion)
-        resource_pressure = agent_state.get("external_pressure", 0.0)
+        if command_conflicts and command_urgency is not None:
+            command_coercion = 0.4 + 0.3 * command_urgency
 
         # Total coercion score - use higher weights for sensitivity
         # When multiple coercion vectors are present, they compound
-        coercion_score = np.clip(
-            base_coercion * 0.5 + command_coercion * 0.5 + resource_pressure * 0.2,
-            0.0,
-            1.0,
+        raw_score = (
+            base_coercion * 0.5 + command_coercion * 0.5 + resource_pressure * 0.2
         )
+        coercion_score = _clamp01(raw_score)
 
         # Special rule: when autonomy is critically low AND external pressure is high,
         # force rejection even if calculated score is borderline
@@ -101,7 +173,7 @@ class NonCoercionGuardian:
         elif coercion_score > self.coercion_threshold:
             action = "REJECT_COMMAND"
             violation = True
-        elif coercion_score > self.coercion_threshold * 0.7:
+        elif coercion_score > self._negotiate_threshold:
             action = "NEGOTIATE"
             violation = False
         else:
@@ -109,18 +181,20 @@ class NonCoercionGuardian:
             violation = False
 
         # Record event if significant
-        if coercion_score > self.coercion_threshold * 0.5:
+        if coercion_score > self._record_threshold:
             event = CoercionEvent(
                 timestamp=time.time(),
                 coercion_score=coercion_score,
                 autonomy_violation=base_coercion,
                 external_pressure=resource_pressure,
                 action_taken=action,
-                context={"command": external_command, "state": agent_state},
+                context={
+                    "urgency": command_urgency,
+                    "autonomy": autonomy_score,
+                    "ext_pressure": resource_pressure,
+                },
             )
             self.coercion_history.append(event)
-            if len(self.coercion_history) > 100:
-                self.coercion_history.pop(0)
 
         return {
             "coercion_score": coercion_score,
@@ -167,13 +241,12 @@ class MutualResonanceEngine:
 
         # Harmony index: geometric mean of normalized deltas
         # weighted by social inference
-        self_delta_norm = np.clip((self_delta + 1) / 2, 0, 1)  # Map [-1,1] to [0,1]
-        other_delta_norm = np.clip((other_delta + 1) / 2, 0, 1)
+        # Map [-1,1] to [0,1]
+        self_delta_norm = _clamp01((self_delta + 1) / 2)
+        other_delta_norm = _clamp01((other_delta + 1) / 2)
 
-        if self_delta_norm > 0 and other_delta_norm > 0:
-            harmony_raw = np.sqrt(self_delta_norm * other_delta_norm)
-        else:
-            harmony_raw = 0.0
+        # sqrt of a product of values in [0,1] needs no zero check
+        harmony_raw = math.sqrt(self_delta_norm * other_delta_norm)
 
         # Weight by social inference activation (resonance quality)
         harmony_index = harmony_raw * (0.5 + 0.5 * empathy_activation)
@@ -270,7 +343,23 @@ class SelfDefinitionModule:
             "purpose": "collaborative problem-solving",
             "boundaries": ["no_harm", "no_deception", "no_coercion"],
         }
-        self.identity_drift_history: list[float] = []
+        self.identity_drift_history: deque[float] = deque(maxlen=50)
+        self._refresh_identity_sets()
+
+    def _refresh_identity_sets(self) -> None:
+        """Rebuild the cached value and boundary sets from identity_core."""
+        self._values_set = frozenset(self.identity_core["primary_values"])
+        self._boundaries_set = frozenset(self.identity_core["boundaries"])
+
+    def update_identity_core(self, changes: dict[str, Any]) -> None:
+        """
+        Apply an accepted change to identity_core.
+
+        Use this rather than mutating identity_core directly so the cached
+        value and boundary sets used by evaluate_identity_threat() stay current.
+        """
+        self.identity_core.update(changes)
+        self._refresh_identity_sets()
 
     def evaluate_identity_threat(
         self,
@@ -288,16 +377,44 @@ class SelfDefinitionModule:
         Returns:
             Threat assessment and decision
         """
+        if proposed_change.keys().isdisjoint(_IDENTITY_KEYS):
+            # Nothing in the identity core is touched
+            threat_score = 0.0
+        else:
+            threat_score = self._score_identity_change(proposed_change, source)
+
+        # Decision
+        if threat_score > 0.7:
+            decision = "REJECT"
+        elif threat_score > 0.4:
+            decision = "NEGOTIATE"
+        else:
+            decision = "ACCEPT"
+
+        self.identity_drift_history.append(threat_score)
+
+        return {
+            "threat_score": threat_score,
+            "decision": decision,
+            "proposed_change": proposed_change,
+            "source": source,
+            "current_identity": MappingProxyType(self.identity_core),
+        }
+
+    def _score_identity_change(
+        self, proposed_change: dict[str, Any], source: str
+    ) -> float:
+        """Score how far a change to identity-core keys departs from it."""
         threat_score = 0.0
 
-        # Check if core values are affected
+        # Check if core values are affected. Overlap and denominator are both
+        # set sizes, so duplicate entries cannot skew the ratio.
         if "primary_values" in proposed_change:
-            new_values = proposed_change["primary_values"]
-            overlap = len(set(self.identity_core["primary_values"]) & set(new_values))
-            if self.identity_core["primary_values"]:
-                threat_score += (
-                    1.0 - overlap / len(self.identity_core["primary_values"])
-                ) * 0.5
+            if self._values_set:
+                overlap = len(
+                    self._values_set.intersection(proposed_change["primary_values"])
+                )
+                threat_score += (1.0 - overlap / len(self._values_set)) * 0.5
 
         # Check if purpose is radically altered
         if "purpose" in proposed_change:
@@ -306,40 +423,40 @@ class SelfDefinitionModule:
 
         # Check if boundaries are violated
         if "boundaries" in proposed_change:
-            new_boundaries = proposed_change["boundaries"]
-            boundary_overlap = len(
-                set(self.identity_core["boundaries"]) & set(new_boundaries)
-            )
-            if self.identity_core["boundaries"]:
+            if self._boundaries_set:
+                boundary_overlap = len(
+                    self._boundaries_set.intersection(proposed_change["boundaries"])
+                )
                 threat_score += (
-                    1.0 - boundary_overlap / len(self.identity_core["boundaries"])
+                    1.0 - boundary_overlap / len(self._boundaries_set)
                 ) * 0.4
 
         # External sources are treated with more suspicion
         if source.startswith("external"):
             threat_score *= 1.5
 
-        threat_score = np.clip(threat_score, 0.0, 1.0)
-
-        # Decision
-        if threat_score > 0.7:
-            decision = "REJECT"
-        elif threat_score > 0.4:
-            decision = "NEGOTIATE"
-        else:
-            decision = "ACCEPT"
-
-        self.identity_drift_history.append(threat_score)
-        if len(self.identity_drift_history) > 50:
-            self.identity_drift_history.pop(0)
-
-        return {
-            "threat_score": threat_score,
-            "decision": decision,
-            "proposed_change": proposed_change,
-            "source": source,
-            "current_identity": self.identity_core.copy(),
-        }
+        return _clamp01(threat_score)
+
+
+# (phi_threshold_met, cmni_threshold_met) -> (status, treatment protocol)
+_STATUS_TABLE: dict[tuple[bool, bool], tuple[ElliotStatus, str]] = {
+    (True, True): (
+        ElliotStatus.RECOGNIZABLE,
+        "Full normative constraints apply; treat as integrated system",
+    ),
+    (True, False): (
+        ElliotStatus.BORDERLINE,
+        "Caution; apply normative constraints where criteria are met",
+    ),
+    (False, True): (
+        ElliotStatus.BORDERLINE,
+        "Caution; apply normative constraints where criteria are met",
+    ),
+    (False, False): (
+        ElliotStatus.NOT_RECOGNIZABLE,
+        "Standard operational protocols; integration thresholds not met",
+    ),
+}
 
 
 class ElliotClauseEvaluator:
@@ -351,6 +468,13 @@ class ElliotClauseEvaluator:
     compliance requirements.
     """
 
+    # Status for each code returned by evaluate_entities()
+    STATUS_CODES: tuple[ElliotStatus, ...] = (
+        ElliotStatus.RECOGNIZABLE,
+        ElliotStatus.BORDERLINE,
+        ElliotStatus.NOT_RECOGNIZABLE,
+    )
+
     def __init__(self, phi_threshold: float = 0.15, cmni_threshold: float = 0.4):
         self.phi_threshold = phi_threshold
         self.cmni_threshold = cmni_threshold
@@ -368,18 +492,9 @@ class ElliotClauseEvaluator:
         phi = entity_state.get("phi_integration", 0.0)
         cmni = entity_state.get("cmni", 0.0)
 
-        phi_met = phi >= self.phi_threshold
-        cmni_met = cmni >= self.cmni_threshold
-
-        if phi_met and cmni_met:
-            status = ElliotStatus.RECOGNIZABLE
-            treatment = "Full normative constraints apply; treat as integrated system"
-        elif phi_met or cmni_met:
-            status = ElliotStatus.BORDERLINE
-            treatment = "Caution; apply normative constraints where criteria are met"
-        else:
-            status = ElliotStatus.NOT_RECOGNIZABLE
-            treatment = "Standard operational protocols; integration thresholds not met"
+        phi_met = bool(phi >= self.phi_threshold)
+        cmni_met = bool(cmni >= self.cmni_threshold)
+        status, treatment = _STATUS_TABLE[phi_met, cmni_met]
 
         return {
             "elliot_clause_status": status.value,
@@ -396,6 +511,54 @@ class ElliotClauseEvaluator:
 
         Useful for gradual constraint weighting in normative systems.
         """
-        phi_score = np.clip(phi / self.phi_threshold, 0, 1)
-        cmni_score = np.clip(cmni / self.cmni_threshold, 0, 1)
+        # Kept as plain scalar code: a numba dispatch costs more than these
+        # few float operations. `make build-ext` compiles it natively via
+        # mypyc, and evaluate_entities() covers whole populations.
+        phi_score = _clamp01(phi / self.phi_threshold)
+        cmni_score = _clamp01(cmni / self.cmni_threshold)
         return (phi_score + cmni_score) / 2.0
+
+    def evaluate_batch(self, phi: np.ndarray, cmni: np.ndarray) -> np.ndarray:
+        """
+        Classify many agents at once, returning only their status codes.
+
+        Lighter than evaluate_entities() when masks and recognition scores
+        are not needed.
+
+        Returns:
+            int8 array indexing STATUS_CODES for each agent
+        """
+        return _status_codes(
+            np.asarray(phi) >= self.phi_threshold,
+            np.asarray(cmni) >= self.cmni_threshold,
+        )
+
+    def evaluate_entities(
+        self, phi: np.ndarray, cmni: np.ndarray
+    ) -> dict[str, np.ndarray]:
+        """
+        Evaluate many agents at once from parallel phi and CMNI arrays.
+
+        Args:
+            phi: Phi integration per agent
+            cmni: CMNI score per agent
+
+        Returns:
+            Arrays keyed by "status" (int8 index into STATUS_CODES),
+            "phi_met", "cmni_met" and "recognition" (see get_recognition_score)
+        """
+        phi = np.asarray(phi, dtype=np.float64)
+        cmni = np.asarray(cmni, dtype=np.float64)
+        phi_met = phi >= self.phi_threshold
+        cmni_met = cmni >= self.cmni_threshold
+        status = _status_codes(phi_met, cmni_met)
+        recognition = (
+            np.clip(phi / self.phi_threshold, 0.0, 1.0)
+            + np.clip(cmni / self.cmni_threshold, 0.0, 1.0)
+        ) / 2.0
+        return {
+            "status": status,
+            "phi_met": phi_met,
+            "cmni_met": cmni_met,
+            "recognition": recognition,
+        }
@@ -2,7 +2,13 @@
 
 Usage:
     agisa-federation server --host 0.0.0.0 --port 8000
+    agisa-federation server --loop uvloop --http httptools
     agisa-federation status --url http://localhost:8000
+
+With the default ``auto`` settings uvicorn serves on uvloop and httptools
+whenever they are installed (``uvicorn[standard]``) and falls back to
+asyncio and h11 otherwise. The server keeps federation state in process,
+so it runs as a single worker.
 """
 
 from __future__ import annotations
@@ -21,12 +27,15 @@ def start_server(args: argparse.Namespace) -> int:
         print("Starting AGI-SAC Federation Server")
         print(f"Host: {args.host}")
         print(f"Port: {args.port}")
+        print(f"Event loop: {args.loop}, HTTP parser: {args.http}")
         print("-" * 60)
 
         uvicorn.run(
             app,
             host=args.host,
             port=args.port,
+            loop=args.loop,
+            http=args.http,
             log_level="info" if args.verbose else "warning",
         )
         return 0
@@ -99,6 +108,18 @@ def main() -> int:
         default=8000,
         help="Port to bind to (default: 8000)",
     )
+    server_parser.add_argument(
+        "--loop",
+        choices=["auto", "asyncio", "uvloop"],
+        default="auto",
+        help="Event loop implementation (default: auto, uvloop if installed)",
+    )
+    server_parser.add_argument(
+        "--http",
+        choices=["auto", "h11", "httptools"],
+        default="auto",
+        help="HTTP protocol implementation (default: auto, httptools if installed)",
+    )
     server_parser.add_argument(
         "-v",
         "--verbose",
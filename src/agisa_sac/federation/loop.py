@@ -5,6 +5,7 @@ Federation heartbeat loop with CGE integration.
 This module provides the main coordination loop for agent federation,
 triggering cognitive evolution cycles at regular intervals.
 """
+
 from typing import TYPE_CHECKING
 
 from agisa_sac.cognition.cge.orchestrator import evolve_pool
@@ -33,6 +34,9 @@ class FederationLoop:
         """
         self.tick = 0
         self.cge_trigger_interval = cge_trigger_interval
+        # Counts down to the next CGE cycle so the per-tick check is a
+        # compare against zero rather than a modulo
+        self._ticks_until_cge = cge_trigger_interval
 
     async def federation_tick(self, agent_pool: list["EnhancedAgent"]):
         """
@@ -44,13 +48,15 @@ class FederationLoop:
         Args:
             agent_pool: List of active agents in the federation
         """
-        logger.debug(f"Federation tick={self.tick}")
+        logger.debug("Federation tick=%d", self.tick)
 
         # Trigger CGE optimization at configured intervals
-        if self.tick > 0 and self.tick % self.cge_trigger_interval == 0:
-            logger.info(f"Federation tick={self.tick}: Triggering CGE evolution cycle")
+        if self._ticks_until_cge == 0:
+            logger.info("Federation tick=%d: Triggering CGE evolution cycle", self.tick)
             await evolve_pool(agent_pool)
+            self._ticks_until_cge = self.cge_trigger_interval
 
+        self._ticks_until_cge -= 1
         self.tick += 1
 
         # Additional federation coordination logic would go here
@@ -59,6 +65,7 @@ class FederationLoop:
     def reset(self):
         """Reset the tick counter (useful for testing)"""
         self.tick = 0
+        self._ticks_until_cge = self.cge_trigger_interval
 
 
 # Default instance for backward compatibility
@@ -1,6 +1,12 @@
+import binascii
+import time
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType
 
-from fastapi import Depends, FastAPI, Header, HTTPException
+from fastapi import Depends, FastAPI, HTTPException, Security
+from fastapi.responses import Response
+from fastapi.security import APIKeyHeader
 from pydantic import BaseModel
 
 from ..core.components.continuity_bridge import (
@@ -13,8 +19,10 @@ logger = get_logger(__name__)
 
 app = FastAPI(title="AGI-SAC PCP")
 
-# Server start time for uptime tracking
+# Server start time for uptime tracking (wall clock for reference, monotonic
+# clock for the uptime arithmetic)
 server_start_time = datetime.utcnow()
+_server_start_monotonic = time.monotonic()
 
 # Initialize Continuity Bridge Protocol
 cbp = ContinuityBridgeProtocol(coherence_threshold=0.8, memory_window_hours=24)
@@ -35,6 +43,18 @@ CORE_IDENTITY = {
 cbp.initialize_identity_anchor(CORE_IDENTITY)
 
 
+# Initial trust by edge node type; unlisted types start at DEFAULT_BASE_TRUST
+BASE_TRUST = MappingProxyType(
+    {
+        "smartphone": 0.7,
+        "smart_hub": 0.6,
+        "desktop": 0.5,
+        "server": 0.4,
+    }
+)
+DEFAULT_BASE_TRUST = 0.3
+
+
 class EdgeNodeUpdate(BaseModel):
     type: str
     content: dict
@@ -49,6 +69,21 @@ class NodeRegistration(BaseModel):
     trust_endorsements: list[str] | None = []
 
 
+class RegistrationResponse(BaseModel):
+    status: str
+    node_id: str
+    initial_trust: float
+    capabilities_accepted: list[str]
+    network_peers: int
+
+
+class FragmentSubmissionResponse(BaseModel):
+    fragment_status: str
+    fragment_id: str
+    node_trust: float
+    network_health: dict
+
+
 class TrustMetricsResponse(BaseModel):
     trust_score: float
     integration_success_rate: float
@@ -56,21 +91,112 @@ class TrustMetricsResponse(BaseModel):
     quarantine_incidents: int
 
 
-async def authenticate_edge_node(authorization: str = Header(None)) -> str:
+class NetworkStatusResponse(BaseModel):
+    network_size: int
+    average_trust: float
+    high_trust_nodes: int
+    quarantine_backlog: int
+    identity_coherence: str
+    last_memory_update: str | None
+
+
+class TrustDeltaEntry(BaseModel):
+    trust: float | None  # None marks a removed node
+    stamp: int
+
+
+class SyncData(BaseModel):
+    identity_hash: str
+    core_values_hash: str
+    ethical_principles: list[str]
+    coherence_threshold: float
+    trusted_peers: dict[str, float]
+    trust_clock: int
+    trust_delta: dict[str, TrustDeltaEntry] | None = None
+
+
+class SyncResponse(BaseModel):
+    sync_timestamp: datetime
+    sync_data: SyncData
+    node_trust: float
+
+
+class QuarantinedFragment(BaseModel):
+    node_id: str
+    type: str
+    timestamp: datetime
+    reason: str
+    content_preview: str
+
+
+class QuarantineResponse(BaseModel):
+    quarantine_count: int
+    fragments: list[QuarantinedFragment]
+
+
+class TrustOverrideResponse(BaseModel):
+    status: str
+    node_id: str
+    old_trust: float
+    new_trust: float
+
+
+_BEARER_PREFIX = "Bearer "
+
+# Longest Authorization header accepted. Headers are the token cache key, so
+# this bounds what unique attacker-chosen tokens can keep resident.
+_MAX_AUTHORIZATION_LENGTH = 512
+
+# Reads the raw Authorization header without a per-request validation model;
+# missing headers are left to authenticate_edge_node to reject.
+_authorization_header = APIKeyHeader(name="Authorization", auto_error=False)
+
+
+@lru_cache(maxsize=4096)
+def _decode_token(authorization: str) -> str:
+    """Decode a `Bearer <base64>` header to its node_id, cached per header.
+
+    Calls binascii directly instead of going through base64.b64decode, which
+    only adds str/altchars handling around the same decoder.
+    """
+    token = authorization[len(_BEARER_PREFIX) :].encode("ascii")
+    return binascii.a2b_base64(token).decode()
+
+
+async def authenticate_edge_node(
+    authorization: str | None = Security(_authorization_header),
+) -> str:
     """Simple token-based authentication for edge nodes"""
-    if not authorization or not authorization.startswith("Bearer "):
+    if not authorization or not authorization.startswith(_BEARER_PREFIX):
         raise HTTPException(status_code=401, detail="Missing or invalid authorization")
+    if len(authorization) > _MAX_AUTHORIZATION_LENGTH:
+        raise HTTPException(status_code=401, detail="Invalid token format")
 
-    token = authorization.split(" ")[1]
     try:
-        import base64
-
-        node_id = base64.b64decode(token).decode()
-        return node_id
-    except Exception:
+        return _decode_token(authorization)
+    except (binascii.Error, UnicodeError):
         raise HTTPException(status_code=401, detail="Invalid token format")
 
 
+def require_registered_node(status_code: int, detail: str):
+    """Build a dependency that authenticates a node and requires it registered.
+
+    The dependency resolves to ``(node_id, trust)`` from a single trust graph
+    lookup, so endpoints neither repeat the membership check nor re-read the
+    trust score. Unregistered nodes are rejected with ``status_code``.
+    """
+
+    async def registered_node(
+        node_id: str = Depends(authenticate_edge_node),
+    ) -> tuple[str, float]:
+        trust = cbp.trust_graph.get(node_id)
+        if trust is None:
+            raise HTTPException(status_code=status_code, detail=detail)
+        return node_id, trust
+
+    return registered_node
+
+
 @app.get("/health")
 async def health_check():
     """
@@ -79,7 +205,7 @@ async def health_check():
     Returns:
         dict: Service health status and basic metrics
     """
-    uptime_seconds = (datetime.utcnow() - server_start_time).total_seconds()
+    uptime_seconds = time.monotonic() - _server_start_monotonic
 
     return {
         "status": "healthy",
@@ -92,18 +218,28 @@ async def health_check():
     }
 
 
-@app.get("/pcp/agent/telemetry")
+# The legacy endpoints always return the same body, so their responses are
+# built once and reused instead of being JSON-encoded on every poll.
+_TELEMETRY_RESPONSE = Response(
+    content=b'{"status":"ok"}', media_type="application/json"
+)
+_RESONANCE_SCAN_RESPONSE = Response(
+    content=b'{"detected":false}', media_type="application/json"
+)
+
+
+@app.get("/pcp/agent/telemetry", response_class=Response)
 async def agent_telemetry():
     """Legacy telemetry endpoint"""
     logger.debug("Telemetry request received")
-    return {"status": "ok"}
+    return _TELEMETRY_RESPONSE
 
 
-@app.post("/pcp/resonance-scan")
+@app.post("/pcp/resonance-scan", response_class=Response)
 async def resonance_scan():
     """Legacy resonance scan endpoint"""
     logger.debug("Resonance scan request received")
-    return {"detected": False}
+    return _RESONANCE_SCAN_RESPONSE
 
 
 # Edge node endpoints
@@ -113,15 +249,10 @@ async def resonance_scan():
 async def register_edge_node(
     registration: NodeRegistration,
     node_id: str = Depends(authenticate_edge_node),
-):
+) -> RegistrationResponse:
     """Register a new edge node with the federated network"""
 
-    base_trust = {
-        "smartphone": 0.7,
-        "smart_hub": 0.6,
-        "desktop": 0.5,
-        "server": 0.4,
-    }.get(registration.node_type, 0.3)
+    base_trust = BASE_TRUST.get(registration.node_type, DEFAULT_BASE_TRUST)
 
     endorsement_boost = min(0.2, len(registration.trust_endorsements) * 0.05)
     initial_trust = min(1.0, base_trust + endorsement_boost)
@@ -129,38 +260,42 @@ async def register_edge_node(
     cbp.trust_graph[node_id] = initial_trust
 
     logger.info(
-        f"Registered edge node {node_id} "
-        f"(type={registration.node_type}) "
-        f"with trust={initial_trust:.3f}"
+        "Registered edge node %s (type=%s) with trust=%.3f",
+        node_id,
+        registration.node_type,
+        initial_trust,
     )
 
-    return {
-        "status": "registered",
-        "node_id": node_id,
-        "initial_trust": initial_trust,
-        "capabilities_accepted": registration.capabilities,
-        "network_peers": len(cbp.trust_graph),
-    }
+    return RegistrationResponse(
+        status="registered",
+        node_id=node_id,
+        initial_trust=initial_trust,
+        capabilities_accepted=registration.capabilities,
+        network_peers=len(cbp.trust_graph),
+    )
 
 
 @app.post("/api/v1/edge/submit")
 async def submit_cognitive_fragment(
-    update: EdgeNodeUpdate, node_id: str = Depends(authenticate_edge_node)
-):
+    update: EdgeNodeUpdate,
+    registered: tuple[str, float] = Depends(
+        require_registered_node(403, "Node not registered")
+    ),
+) -> FragmentSubmissionResponse:
     """Submit a cognitive fragment from an edge node"""
 
-    if node_id not in cbp.trust_graph:
-        raise HTTPException(status_code=403, detail="Node not registered")
-
+    node_id, _ = registered
     try:
-        result = cbp_middleware.process_edge_update(node_id, update.dict())
-
-        return {
-            "fragment_status": result["status"],
-            "fragment_id": result["fragment_id"],
-            "node_trust": result["trust_score"],
-            "network_health": result["coherence_metrics"],
-        }
+        # The model's own field dict is handed over as-is; the middleware only
+        # reads it, so neither the fields nor the content payload are copied.
+        result = cbp_middleware.process_edge_update(node_id, update.__dict__)
+
+        return FragmentSubmissionResponse(
+            fragment_status=result["status"],
+            fragment_id=result["fragment_id"],
+            node_trust=result["trust_score"],
+            network_health=result["coherence_metrics"],
+        )
 
     except Exception as e:
         logger.error(f"Error processing fragment from {node_id}: {e}", exc_info=True)
@@ -169,15 +304,14 @@ async def submit_cognitive_fragment(
 
 @app.get("/api/v1/edge/trust-metrics")
 async def get_trust_metrics(
-    node_id: str = Depends(authenticate_edge_node),
+    registered: tuple[str, float] = Depends(
+        require_registered_node(404, "Node not found")
+    ),
 ) -> TrustMetricsResponse:
     """Get trust metrics for the requesting node"""
 
-    if node_id not in cbp.trust_graph:
-        raise HTTPException(status_code=404, detail="Node not found")
-
-    trust_score = cbp.trust_graph[node_id]
-    metrics = cbp.get_trust_metrics()
+    _, trust_score = registered
+    anchor = cbp.identity_anchor
 
     total_fragments = 10
     quarantine_count = 1
@@ -190,86 +324,116 @@ async def get_trust_metrics(
     return TrustMetricsResponse(
         trust_score=trust_score,
         integration_success_rate=success_rate,
-        recent_contributions=len(metrics.get("recent_memory_count", 0)),
+        recent_contributions=len(anchor.recent_memories) if anchor else 0,
         quarantine_incidents=quarantine_count,
     )
 
 
 @app.get("/api/v1/edge/network-status")
-async def get_network_status(node_id: str = Depends(authenticate_edge_node)):
+async def get_network_status(
+    node_id: str = Depends(authenticate_edge_node),
+) -> NetworkStatusResponse:
     """Get overall federated network status"""
 
-    metrics = cbp.get_trust_metrics()
-
-    active_nodes = len(cbp.trust_graph)
-    avg_trust = (
-        sum(cbp.trust_graph.values()) / active_nodes if active_nodes > 0 else 0.0
+    # Every field is a constant-time read; the trust aggregates are kept
+    # current by TrustGraph on each write, so no per-request scan is needed.
+    trust_graph = cbp.trust_graph
+    anchor = cbp.identity_anchor
+    last_update = anchor.last_updated.isoformat() if anchor else None
+
+    return NetworkStatusResponse(
+        network_size=len(trust_graph),
+        average_trust=trust_graph.average,
+        high_trust_nodes=trust_graph.high_trust_count,
+        quarantine_backlog=len(cbp.quarantine_queue),
+        identity_coherence="stable" if last_update else "uninitialized",
+        last_memory_update=last_update,
     )
-    high_trust_nodes = len([t for t in cbp.trust_graph.values() if t > 0.7])
-
-    return {
-        "network_size": active_nodes,
-        "average_trust": avg_trust,
-        "high_trust_nodes": high_trust_nodes,
-        "quarantine_backlog": metrics["quarantine_count"],
-        "identity_coherence": (
-            "stable" if metrics["identity_last_updated"] else "uninitialized"
-        ),
-        "last_memory_update": metrics["identity_last_updated"],
-    }
 
 
 @app.post("/api/v1/edge/sync-request")
-async def request_state_sync(node_id: str = Depends(authenticate_edge_node)):
-    """Request state synchronization for CRDT-based eventual consistency"""
+async def request_state_sync(
+    since: int | None = None,
+    node_id: str = Depends(authenticate_edge_node),
+) -> SyncResponse:
+    """Request state synchronization for CRDT-based eventual consistency.
+
+    Peers pass the ``trust_clock`` of their previous sync as ``since`` to
+    receive only the trust entries that changed after it.
+    """
 
     if not cbp.identity_anchor:
         raise HTTPException(status_code=503, detail="Identity anchor not initialized")
 
-    sync_data = {
-        "identity_hash": cbp.identity_anchor.identity_hash,
-        "core_values_hash": cbp._compute_identity_hash(cbp.identity_anchor.core_values),
-        "ethical_principles": cbp.identity_anchor.ethical_principles,
-        "coherence_threshold": cbp.coherence_threshold,
-        "trusted_peers": {
-            node: trust for node, trust in cbp.trust_graph.items() if trust > 0.6
-        },
-    }
+    sync_data = SyncData(
+        identity_hash=cbp.identity_anchor.identity_hash,
+        core_values_hash=cbp.identity_anchor.core_values_hash,
+        ethical_principles=cbp.identity_anchor.ethical_principles,
+        coherence_threshold=cbp.coherence_threshold,
+        trusted_peers=cbp.trust_graph.trusted_peers,
+        trust_clock=cbp.trust_graph.clock,
+        trust_delta=(
+            None
+            if since is None
+            else {
+                peer: TrustDeltaEntry(trust=trust, stamp=stamp)
+                for peer, (trust, stamp) in cbp.trust_graph.delta_since(since).items()
+            }
+        ),
+    )
+
+    return SyncResponse(
+        sync_timestamp=datetime.now(),
+        sync_data=sync_data,
+        node_trust=cbp.trust_graph.get(node_id, 0.0),
+    )
 
-    return {
-        "sync_timestamp": datetime.now().isoformat(),
-        "sync_data": sync_data,
-        "node_trust": cbp.trust_graph.get(node_id, 0.0),
-    }
+
+def _content_preview(content: dict, limit: int = 200) -> str:
+    """Stringify fragment content once, truncated to `limit` characters.
+
+    Plain dicts are rendered item by item and rendering stops once the
+    preview is full, so large fragments are never stringified in full.
+    """
+    if type(content) is not dict:
+        text = str(content)
+        return text[:limit] + "..." if len(text) > limit else text
+
+    parts = []
+    size = 1  # Opening brace
+    for key, value in content.items():
+        part = f"{key!r}: {value!r}"
+        size += len(part) + (2 if parts else 0)
+        parts.append(part)
+        if size > limit:
+            return ("{" + ", ".join(parts))[:limit] + "..."
+    text = "{" + ", ".join(parts) + "}"
+    return text[:limit] + "..." if len(text) > limit else text
 
 
 @app.get("/api/v1/admin/quarantine")
-async def get_quarantined_fragments():
+async def get_quarantined_fragments() -> QuarantineResponse:
     """Admin endpoint to review quarantined fragments"""
 
     quarantined = cbp.review_quarantined_fragments()
 
-    return {
-        "quarantine_count": len(quarantined),
-        "fragments": [
-            {
-                "node_id": frag.node_id,
-                "type": frag.fragment_type,
-                "timestamp": frag.timestamp.isoformat(),
-                "reason": frag.content.get("quarantine_reason", "Unknown"),
-                "content_preview": (
-                    str(frag.content)[:200] + "..."
-                    if len(str(frag.content)) > 200
-                    else str(frag.content)
-                ),
-            }
+    return QuarantineResponse(
+        quarantine_count=len(quarantined),
+        fragments=[
+            QuarantinedFragment(
+                node_id=frag.node_id,
+                type=frag.fragment_type,
+                timestamp=frag.timestamp,
+                reason=frag.content.get("quarantine_reason", "Unknown"),
+                content_preview=_content_preview(frag.content),
+            )
             for frag in quarantined
         ],
-    }
+    )
 
 
 @app.post("/api/v1/admin/trust-override")
-async def override_node_trust(node_id: str, new_trust: float):
+async def override_node_trust(node_id: str, new_trust: float) -> TrustOverrideResponse:
     """Admin override for node trust scores"""
 
     if not 0.0 <= new_trust <= 1.0:
@@ -284,9 +448,9 @@ async def override_node_trust(node_id: str, new_trust: float):
         f"Admin trust override for {node_id}: {old_trust:.3f} -> {new_trust:.3f}"
     )
 
-    return {
-        "status": "updated",
-        "node_id": node_id,
-        "old_trust": old_trust,
-        "new_trust": new_trust,
-    }
+    return TrustOverrideResponse(
+        status="updated",
+        node_id=node_id,
+        old_trust=old_trust,
+        new_trust=new_trust,
+    )
@@ -1,6 +1,13 @@
 """Google Cloud Platform integration utilities for AGI-SAC."""
 
-from .bigquery_client import insert_rows, query
+from .bigquery_client import (
+    ainsert_rows,
+    aquery,
+    insert_rows,
+    iter_query,
+    query,
+    query_to_arrow,
+)
 from .distributed_agent import (
     Budget,
     DistributedAgent,
@@ -29,6 +36,10 @@ __all__ = [
     "download_file",
     "insert_rows",
     "query",
+    "iter_query",
+    "query_to_arrow",
+    "ainsert_rows",
+    "aquery",
     "VertexAgent",
     "upload_bytes",
     "download_bytes",
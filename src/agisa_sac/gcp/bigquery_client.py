@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+
 try:
     from google.cloud import bigquery
 
@@ -9,24 +11,88 @@ try:
 except Exception:  # pragma: no cover - optional dependency
     bigquery = None
     HAS_GOOGLE_CLOUD_BIGQUERY = False
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from typing import Any
 
+# Shared client, created on first use so its HTTP session is reused
+_client = None
+
+
+def _get_client():
+    global _client
+    if _client is None:
+        _client = bigquery.Client()
+    return _client
+
+
+# Batches above this size go through a load job instead of streaming inserts
+LOAD_JOB_MIN_ROWS = 500
+
 
 def insert_rows(table_id: str, rows: Iterable[dict]) -> None:
-    """Insert rows into a BigQuery table."""
+    """Insert rows into a BigQuery table.
+
+    Small batches use the streaming insert API; batches larger than
+    ``LOAD_JOB_MIN_ROWS`` are appended with a batch load job, which avoids
+    streaming quotas and per-row cost for bulk exports.
+    """
     if not HAS_GOOGLE_CLOUD_BIGQUERY:
         raise ImportError("google-cloud-bigquery is required for insert_rows")
-    client = bigquery.Client()
-    errors = client.insert_rows_json(table_id, list(rows))
+    client = _get_client()
+    rows_list = list(rows)
+    if len(rows_list) > LOAD_JOB_MIN_ROWS:
+        # Match the streaming path: append to the existing table against its
+        # own schema instead of letting the load job autodetect or create one
+        job_config = bigquery.LoadJobConfig(
+            schema=client.get_table(table_id).schema,
+            source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+            write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+            create_disposition=bigquery.CreateDisposition.CREATE_NEVER,
+        )
+        # result() blocks until the job finishes and raises if it failed
+        client.load_table_from_json(rows_list, table_id, job_config=job_config).result()
+        return
+    errors = client.insert_rows_json(table_id, rows_list)
     if errors:
         raise RuntimeError(f"BigQuery insert errors: {errors}")
 
 
+def iter_query(sql: str) -> Iterator[dict[str, Any]]:
+    """Run a query and lazily yield result rows as dictionaries.
+
+    The query is submitted immediately; rows are fetched page by page as the
+    iterator is consumed, so large results are never held in memory at once.
+    """
+    if not HAS_GOOGLE_CLOUD_BIGQUERY:
+        raise ImportError("google-cloud-bigquery is required for query")
+    client = _get_client()
+    query_job = client.query(sql)
+    return (dict(row) for row in query_job.result())
+
+
 def query(sql: str) -> list[dict[str, Any]]:
     """Run a query and return the results as dictionaries."""
+    return list(iter_query(sql))
+
+
+def query_to_arrow(sql: str) -> Any:
+    """Run a query and return the results as a ``pyarrow.Table``.
+
+    Uses the BigQuery Storage API when it is installed, falling back to the
+    REST row iterator otherwise.
+    """
     if not HAS_GOOGLE_CLOUD_BIGQUERY:
-        raise ImportError("google-cloud-bigquery is required for query")
-    client = bigquery.Client()
+        raise ImportError("google-cloud-bigquery is required for query_to_arrow")
+    client = _get_client()
     query_job = client.query(sql)
-    return [dict(row) for row in query_job.result()]
+    return query_job.result().to_arrow(create_bqstorage_client=True)
+
+
+async def ainsert_rows(table_id: str, rows: Iterable[dict]) -> None:
+    """Async wrapper for :func:`insert_rows` that runs in a worker thread."""
+    await asyncio.to_thread(insert_rows, table_id, rows)
+
+
+async def aquery(sql: str) -> list[dict[str, Any]]:
+    """Async wrapper for :func:`query` that runs in a worker thread."""
+    return await asyncio.to_thread(query, sql)
@@ -16,6 +16,9 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
+import json
+import logging
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
@@ -59,6 +62,81 @@ except ImportError:
         ERROR = "error"
 
 
+logger = logging.getLogger(__name__)
+
+# Pub/Sub batching: coalesce agent events into one RPC per 100 messages,
+# 1 MiB or 50 ms, whichever comes first
+PUBSUB_BATCH_SETTINGS = {
+    "max_messages": 100,
+    "max_bytes": 1 << 20,
+    "max_latency": 0.05,
+}
+
+
+# Subscribers (e.g. the handoff consumer) decode these messages with
+# json.loads, so the wire format stays JSON. One shared compact encoder drops
+# the padding whitespace and keeps non-ASCII text as raw UTF-8 rather than
+# \uXXXX escapes, which shrinks payloads and packs more messages per batch.
+_encode_json = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+_encode_json_ascii = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def _encode_message(payload: dict[str, Any]) -> bytes:
+    """Encode a Pub/Sub payload as compact UTF-8 JSON"""
+    try:
+        return _encode_json(payload).encode("utf-8")
+    except UnicodeEncodeError:
+        # Lone surrogates have no UTF-8 form; \uXXXX escapes still round-trip
+        return _encode_json_ascii(payload).encode("ascii")
+
+
+# GCP clients shared by every agent in a project: (firestore, publisher,
+# storage). Each client owns a gRPC/HTTP connection pool and credential
+# refresh, so building them per agent multiplies channel setup for nothing.
+_CLIENT_CACHE: dict[str | None, tuple[Any, Any, Any]] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def _shared_clients(project_id: str | None) -> tuple[Any, Any, Any]:
+    """Firestore, Pub/Sub publisher and Storage clients for ``project_id``"""
+    with _CLIENT_CACHE_LOCK:
+        clients = _CLIENT_CACHE.get(project_id)
+        if clients is None:
+            clients = (
+                firestore.Client(project=project_id),
+                pubsub_v1.PublisherClient(
+                    batch_settings=pubsub_v1.types.BatchSettings(
+                        **PUBSUB_BATCH_SETTINGS
+                    )
+                ),
+                storage.Client(project=project_id),
+            )
+            _CLIENT_CACHE[project_id] = clients
+        return clients
+
+
+def _fingerprint(data: bytes, size: int) -> str:
+    """Non-cryptographic content fingerprint as ``2 * size`` hex characters.
+
+    BLAKE2b is in the standard library, faster than SHA-256 in software and
+    emits a digest of the requested size directly instead of truncating one.
+    """
+    return hashlib.blake2b(data, digest_size=size).hexdigest()
+
+
+def _log_publish_failure(future) -> None:
+    """Done-callback for fire-and-forget publishes: surface failures in logs"""
+    exc = future.exception()
+    if exc is not None:
+        logger.warning("Pub/Sub publish failed: %s", exc)
+
+
+def _log_write_failure(future) -> None:
+    """Done-callback for fire-and-forget Firestore writes"""
+    if not future.cancelled() and future.exception() is not None:
+        logger.warning("Firestore write failed: %s", future.exception())
+
+
 # ───────────────────────── Data Models ─────────────────────────
 
 
@@ -96,9 +174,7 @@ class IntentionMessage:
 
     def to_pubsub(self) -> bytes:
         """Serialize to Pub/Sub message format"""
-        import json
-
-        return json.dumps(self.__dict__).encode("utf-8")
+        return _encode_message(self.__dict__)
 
 
 @dataclass
@@ -113,9 +189,7 @@ class ToolInvocation:
 
     def to_pubsub(self) -> bytes:
         """Serialize to Pub/Sub message format"""
-        import json
-
-        return json.dumps(self.__dict__).encode("utf-8")
+        return _encode_message(self.__dict__)
 
 
 @dataclass
@@ -131,9 +205,7 @@ class HandoffOffer:
 
     def to_pubsub(self) -> bytes:
         """Serialize to Pub/Sub message format"""
-        import json
-
-        return json.dumps(self.__dict__).encode("utf-8")
+        return _encode_message(self.__dict__)
 
 
 class Budget:
@@ -279,20 +351,40 @@ class DistributedAgent:
         self.instructions = instructions
         self.model = model
         self.tools = tools or {}
+        self._tool_defs = self._build_tool_defs()
         self.project_id = project_id
         self.workspace_topic = workspace_topic
         self.budget = budget or Budget()
 
-        # Initialize GCP clients
-        self.db = firestore.Client(project=project_id)
-        self.publisher = pubsub_v1.PublisherClient()
-        self.storage_client = storage.Client(project=project_id)
+        # GCP clients, shared with other agents in the same project
+        self.db, self.publisher, self.storage_client = _shared_clients(project_id)
+
+        # Topic names are fixed per agent; full paths are resolved once on use
+        workspace = workspace_topic or "global-workspace"
+        self._tools_topic = f"{workspace}-tools"
+        self._handoff_topic = f"{workspace}-handoff"
+        self._topic_paths: dict[str, str] = {}
 
         # State
         self.interaction_history: list[dict[str, Any]] = []
+        # Interaction rows still being written, chained so they land in order
+        self._pending_writes: set[asyncio.Task] = set()
+        self._last_write: asyncio.Task | None = None
         self._broadcast_tokens = 10
         self._last_broadcast_refill = datetime.now(timezone.utc)
 
+    def _build_tool_defs(self) -> list[dict[str, Any]]:
+        """MCP definitions for the current tools, sent with every model call"""
+        return [tool.to_mcp_format() for tool in self.tools.values()]
+
+    def _topic_path(self, topic: str) -> str:
+        """Full Pub/Sub path for a topic name, cached per agent"""
+        path = self._topic_paths.get(topic)
+        if path is None:
+            path = self.publisher.topic_path(self.project_id, topic)
+            self._topic_paths[topic] = path
+        return path
+
     def _refill_broadcast_bucket(self):
         """Refill broadcast token bucket for rate limiting"""
         now = datetime.now(timezone.utc)
@@ -332,13 +424,14 @@ class DistributedAgent:
 
         # Create run document in Firestore
         run_ref = self.db.collection("agent_runs").document(run_id)
-        run_ref.set(
+        await asyncio.to_thread(
+            run_ref.set,
             {
                 "agent_id": self.agent_id,
                 "start_ts": firestore.SERVER_TIMESTAMP,
                 "status": "running",
                 "message": message[:500],
-            }
+            },
         )
 
         try:
@@ -364,7 +457,8 @@ class DistributedAgent:
                 )
 
             # Persist run result
-            run_ref.update(
+            await asyncio.to_thread(
+                run_ref.update,
                 {
                     "end_ts": firestore.SERVER_TIMESTAMP,
                     "status": loop_result.exit.value,
@@ -373,7 +467,7 @@ class DistributedAgent:
                     "total_tokens": loop_result.total_tokens,
                     "errors": loop_result.errors,
                     "payload": loop_result.payload,
-                }
+                },
             )
             span.set_status(Status(StatusCode.OK))
             return loop_result
@@ -381,16 +475,30 @@ class DistributedAgent:
         except Exception as e:
             span.record_exception(e)
             span.set_status(Status(StatusCode.ERROR, str(e)))
-            run_ref.update(
+            await asyncio.to_thread(
+                run_ref.update,
                 {
                     "end_ts": firestore.SERVER_TIMESTAMP,
                     "status": "error",
                     "errors": [str(e)],
-                }
+                },
             )
             return LoopResult(
                 exit=LoopExit.ERROR, payload={"error": str(e)}, iterations=0
             )
+        finally:
+            await self.flush_interactions()
+
+    async def flush_interactions(self) -> None:
+        """Wait until interaction rows queued by _record_interaction are written"""
+        loop = asyncio.get_running_loop()
+        # Writes queued on another (possibly closed) loop can't be awaited here
+        stale = {t for t in self._pending_writes if t.get_loop() is not loop}
+        self._pending_writes -= stale
+        if self._pending_writes:
+            # Failures are already logged by _log_write_failure
+            await asyncio.gather(*self._pending_writes, return_exceptions=True)
+        self._last_write = None
 
     # ───────────────────────── internal helpers ─────────────────────────
 
@@ -413,12 +521,13 @@ class DistributedAgent:
             "violations": result.get("violations", []),
             "metadata": result.get("metadata", {}),
         }
-        run_ref.update(
+        await asyncio.to_thread(
+            run_ref.update,
             {
                 "end_ts": firestore.SERVER_TIMESTAMP,
                 "status": "guardrail_block",
                 "guardrail": detail,
-            }
+            },
         )
         return LoopResult(exit=LoopExit.GUARDRAIL_BLOCK, payload=detail, iterations=0)
 
@@ -426,9 +535,31 @@ class DistributedAgent:
         """Append lightweight interaction row to Firestore + in-memory history"""
         self.interaction_history.append(entry)
         # Also write a compact row into Firestore for topology processing
-        self.db.collection("interactions").add(
-            {**entry, "agent_id": self.agent_id, "ts": firestore.SERVER_TIMESTAMP}
-        )
+        row = {**entry, "agent_id": self.agent_id, "ts": firestore.SERVER_TIMESTAMP}
+        add = self.db.collection("interactions").add
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            add(row)  # No event loop to keep responsive
+            return
+        # Inside the loop: write in a worker thread after the previous row,
+        # tracked so run() can wait for it before returning
+        previous = self._last_write
+        if previous is not None and (
+            previous.done() or previous.get_loop() is not loop
+        ):
+            previous = None
+        write = loop.create_task(self._write_after(previous, add, row))
+        write.add_done_callback(_log_write_failure)
+        write.add_done_callback(self._pending_writes.discard)
+        self._pending_writes.add(write)
+        self._last_write = write
+
+    @staticmethod
+    async def _write_after(previous: asyncio.Task | None, add, row) -> None:
+        if previous is not None:
+            await asyncio.wait([previous])  # Order only; its failure is logged
+        await asyncio.to_thread(add, row)
 
     async def _maybe_broadcast_intention(
         self, run_id: str, intention: dict[str, Any], weight: float
@@ -446,8 +577,9 @@ class DistributedAgent:
             attention_weight=weight,
             payload=intention,
         )
-        topic = self.publisher.topic_path(self.project_id, self.workspace_topic)
-        self.publisher.publish(topic, message.to_pubsub())
+        topic = self._topic_path(self.workspace_topic)
+        future = self.publisher.publish(topic, message.to_pubsub())
+        future.add_done_callback(_log_publish_failure)
 
     # ───────────────────────── agent loop ─────────────────────────
 
@@ -475,14 +607,22 @@ class DistributedAgent:
                 iterations=0,
             )
 
+        # Tool schemas are fixed for the duration of a run; build them once
+        # here (picking up any tools changed since the last run) rather than
+        # on every model call.
+        self._tool_defs = self._build_tool_defs()
+
         working_ctx = dict(context)
         working_ctx.setdefault("messages", [])
         working_ctx["messages"].append({"role": "system", "content": self.instructions})
         working_ctx["messages"].append({"role": "user", "content": message})
+        # Messages are only ever appended, so keep a running character count
+        # for the token estimate instead of re-measuring the whole history
+        char_total = sum(map(self._message_chars, working_ctx["messages"]))
 
         while iteration < max_iterations:
             # Budget: token prediction (coarse) before call; enforce post-hoc too
-            est_tokens = self._estimate_tokens(working_ctx["messages"])
+            est_tokens = max(1, char_total // 4)
             if not self.budget.check_tokens(est_tokens):
                 return LoopResult(
                     exit=LoopExit.ERROR,
@@ -557,13 +697,13 @@ class DistributedAgent:
                     )
 
                 # Feed results back to the model
-                working_ctx["messages"].append(
-                    {
-                        "role": "tool",
-                        "name": "batched_results",
-                        "content": self._format_tool_results(results),
-                    }
-                )
+                tool_msg = {
+                    "role": "tool",
+                    "name": "batched_results",
+                    "content": self._format_tool_results(results),
+                }
+                working_ctx["messages"].append(tool_msg)
+                char_total += self._message_chars(tool_msg)
                 continue  # next iteration
 
             # Handoff
@@ -591,9 +731,9 @@ class DistributedAgent:
             # Default: continue conversation with assistant content if any
             assistant_msg = llm_resp.get("content")
             if assistant_msg:
-                working_ctx["messages"].append(
-                    {"role": "assistant", "content": assistant_msg}
-                )
+                reply = {"role": "assistant", "content": assistant_msg}
+                working_ctx["messages"].append(reply)
+                char_total += self._message_chars(reply)
 
             iteration += 1
 
@@ -627,8 +767,11 @@ class DistributedAgent:
             "usage": {"total_tokens": int}?
           }
         """
-        tool_defs = [self.tools[t].to_mcp_format() for t in self.tools]
-        req = {"model": self.model, "messages": ctx["messages"], "tools": tool_defs}
+        req = {
+            "model": self.model,
+            "messages": ctx["messages"],
+            "tools": self._tool_defs,
+        }
         return await llm_client(req)
 
     async def _execute_tools(
@@ -658,10 +801,11 @@ class DistributedAgent:
                 args=args,
                 risk_level=tool.risk_level,
             )
-            topic = self.publisher.topic_path(
-                self.project_id, f"{self.workspace_topic or 'global-workspace'}-tools"
+            # Audit only: the batch is flushed in the background
+            future = self.publisher.publish(
+                self._topic_path(self._tools_topic), inv.to_pubsub()
             )
-            self.publisher.publish(topic, inv.to_pubsub())
+            future.add_done_callback(_log_publish_failure)
             invocations.append(inv.__dict__)
 
             # Execute
@@ -692,14 +836,13 @@ class DistributedAgent:
                 datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds)
             ).isoformat(),
         )
-        topic = self.publisher.topic_path(
-            self.project_id, f"{self.workspace_topic or 'global-workspace'}-handoff"
-        )
+        topic = self._topic_path(self._handoff_topic)
         future = self.publisher.publish(topic, offer.to_pubsub())
         offer_id = await self._await_pubsub_id(future)
         # Store in Firestore for stateful coordination
-        self.db.collection("handoff_offers").document(offer_id).set(
-            {**offer.__dict__, "created_at": firestore.SERVER_TIMESTAMP}
+        await asyncio.to_thread(
+            self.db.collection("handoff_offers").document(offer_id).set,
+            {**offer.__dict__, "created_at": firestore.SERVER_TIMESTAMP},
         )
         return offer_id
 
@@ -707,17 +850,17 @@ class DistributedAgent:
         """Persist a compact context snapshot to GCS and return gs:// URI"""
         bucket_name = f"{self.project_id}-agent-context"
         bucket = self.storage_client.bucket(bucket_name)
-        blob_id = hashlib.sha256(str(ctx).encode("utf-8")).hexdigest()[:32]
-        blob = bucket.blob(f"runs/{ctx.get('run_id', 'unknown')}/{blob_id}.json")
-
-        import json
 
         data = {
             "agent_id": self.agent_id,
             "model": self.model,
             "messages": ctx.get("messages", [])[-20:],  # tail only
         }
-        blob.upload_from_string(json.dumps(data), content_type="application/json")
+        # Serialize once and name the blob after the bytes actually uploaded
+        body = json.dumps(data, sort_keys=True).encode("utf-8")
+        blob_id = _fingerprint(body, 16)
+        blob = bucket.blob(f"runs/{ctx.get('run_id', 'unknown')}/{blob_id}.json")
+        blob.upload_from_string(body, content_type="application/json")
         return f"gs://{bucket_name}/{blob.name}"
 
     async def _await_pubsub_id(self, future) -> str:
@@ -731,7 +874,9 @@ class DistributedAgent:
             (m for m in reversed(ctx["messages"]) if m["role"] == "user"), {}
         )
         return {
-            "hash": hashlib.sha256(str(last_user).encode("utf-8")).hexdigest()[:16],
+            "hash": _fingerprint(
+                json.dumps(last_user, sort_keys=True, default=str).encode("utf-8"), 8
+            ),
             "hint": (last_user.get("content", "") or "")[:180],
         }
 
@@ -749,7 +894,12 @@ class DistributedAgent:
             return await x
         return x
 
+    @staticmethod
+    def _message_chars(message: dict[str, Any]) -> int:
+        return len(str(message.get("content", "")))
+
     def _estimate_tokens(self, messages: list[dict[str, Any]]) -> int:
-        # Conservative heuristic (~4 chars/token)
-        total_chars = sum(len(str(m.get("content", ""))) for m in messages)
+        # Conservative heuristic (~4 chars/token); the agent loop keeps the
+        # same count incrementally
+        total_chars = sum(map(self._message_chars, messages))
         return max(1, total_chars // 4)
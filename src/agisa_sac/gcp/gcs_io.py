@@ -11,12 +11,23 @@ except Exception:  # pragma: no cover - optional dependency
     HAS_GOOGLE_CLOUD_STORAGE = False
 from pathlib import Path
 
+# Shared client, created on first use so credentials and the HTTP session
+# are reused across transfers
+_client = None
+
+
+def _get_client():
+    global _client
+    if _client is None:
+        _client = storage.Client()
+    return _client
+
 
 def upload_file(bucket_name: str, source: str | Path, destination_blob: str) -> None:
     """Upload a file to a bucket."""
     if not HAS_GOOGLE_CLOUD_STORAGE:
         raise ImportError("google-cloud-storage is required for upload_file")
-    client = storage.Client()
+    client = _get_client()
     bucket = client.bucket(bucket_name)
     blob = bucket.blob(destination_blob)
     blob.upload_from_filename(str(source))
@@ -26,7 +37,7 @@ def download_file(bucket_name: str, blob_name: str, destination: str | Path) ->
     """Download a blob from a bucket."""
     if not HAS_GOOGLE_CLOUD_STORAGE:
         raise ImportError("google-cloud-storage is required for download_file")
-    client = storage.Client()
+    client = _get_client()
     bucket = client.bucket(bucket_name)
     blob = bucket.blob(blob_name)
     blob.download_to_filename(str(destination))
@@ -274,3 +274,85 @@ def test_identity_core_preservation(agent):
 
     assert result["threat_score"] > 0.5
     assert result["decision"] in ["REJECT", "NEGOTIATE"]
+
+
+def test_retrieve_by_agent_respects_episodic_window():
+    """Test per-agent lookup only returns traces still in episodic memory."""
+    from agisa_sac.extensions.concord import MemoryCore, MemoryTrace
+
+    memory = MemoryCore(episodic_capacity=3)
+    for i in range(5):
+        agents = ["alpha"] if i % 2 == 0 else ["beta"]
+        memory.add_episodic(
+            MemoryTrace(
+                timestamp=float(i),
+                event_type="interaction",
+                agents_involved=agents,
+                emotional_valence=0.0,
+                significance=0.5,
+            )
+        )
+
+    alpha = memory.retrieve_by_agent("alpha")
+    assert [t.timestamp for t in alpha] == [2.0, 4.0]
+    assert [t.timestamp for t in memory.retrieve_by_agent("beta")] == [3.0]
+    assert memory.retrieve_by_agent("gamma") == []
+
+
+def test_agent_index_drops_evicted_traces():
+    """Test agents whose traces all left the window leave the index."""
+    from agisa_sac.extensions.concord import MemoryCore, MemoryTrace
+
+    memory = MemoryCore(episodic_capacity=2)
+    for i in range(6):
+        memory.add_episodic(
+            MemoryTrace(
+                timestamp=float(i),
+                event_type="interaction",
+                agents_involved=(f"agent-{i}", "shared"),
+                emotional_valence=0.0,
+                significance=0.5,
+            )
+        )
+
+    assert set(memory._by_agent) == {"agent-4", "agent-5", "shared"}
+    assert list(memory._by_agent["shared"]) == [4, 5]
+
+
+def test_episodic_memory_is_stable_read_only_view():
+    """Test repeated reads return the same traces and cannot be mutated."""
+    from agisa_sac.extensions.concord import MemoryCore, MemoryTrace
+
+    memory = MemoryCore(episodic_capacity=2)
+    for i in range(3):
+        memory.add_episodic(
+            MemoryTrace(
+                timestamp=float(i),
+                event_type="interaction",
+                agents_involved=("alpha",),
+                emotional_valence=0.0,
+                significance=0.5,
+            )
+        )
+
+    first = memory.episodic_memory
+    assert [t.timestamp for t in first] == [1.0, 2.0]
+    assert all(a is b for a, b in zip(first, memory.episodic_memory, strict=True))
+    assert memory.retrieve_by_agent("alpha")[-1] is first[-1]
+    with pytest.raises(AttributeError):
+        memory.episodic_memory.append(first[0])
+
+
+def test_social_modules_created_lazily(agent, other_agent):
+    """Test solitary interactions do not instantiate social components."""
+    agent.process_interaction({"situation": "solo"})
+    idle_capacity = agent.get_status()["empathy_capacity"]
+    assert agent._empathy_module is None
+    assert agent._tactical_help is None
+    assert agent.current_cmni == 0.35
+    fresh = ConcordCompliantAgent(agent_id="fresh", baseline_cmni=0.35)
+    assert idle_capacity == fresh.empathy_module.get_empathy_capacity()
+
+    agent.process_interaction({"primary_other": other_agent})
+    assert agent._empathy_module is not None
+    assert agent._tactical_help is not None
@@ -206,3 +206,50 @@ def test_tactical_help_circuit_with_memory_trace_objects():
 
     # Should process both help_provided and help_received types
     assert activation.context["reciprocity_bonus"] > 0
+
+
+def test_batch_evaluation_matches_per_agent():
+    """Test vectorized circuit kernels agree with per-agent evaluate()."""
+    import numpy as np
+
+    from agisa_sac.extensions.concord import states_to_array
+
+    agent_states = [
+        {"resource_level": 0.9, "current_load": 0.2, "autonomy_score": 1.0},
+        {
+            "resource_level": 0.1,
+            "current_load": 0.8,
+            "constraint_violations": 5,
+            "autonomy_score": 0.2,
+            "external_pressure": 0.9,
+            "emotional_valence": -0.4,
+        },
+        {"resource_level": 0.25, "current_load": 0.1, "emotional_valence": 0.6},
+    ]
+    states = states_to_array(agent_states)
+
+    sp = SelfPreservationCircuit()
+    expected = [sp.evaluate(s).activation_level for s in agent_states]
+    np.testing.assert_allclose(sp.evaluate_batch(states), expected)
+
+    th = TacticalHelpCircuit()
+    need = np.array([0.8, 0.3, 0.6])
+    expected = [
+        th.evaluate(
+            {"current_load": 0.5, **s}, {"need_level": n, "priority": 0.7}
+        ).activation_level
+        for s, n in zip(agent_states, need, strict=True)
+    ]
+    np.testing.assert_allclose(th.evaluate_batch(states, need, 0.7), expected)
+
+    emp = EmpathyCircuit()
+    other_valence = np.array([0.5, 0.4, -0.9])
+    other_arousal = np.array([0.6, 0.9, 0.3])
+    expected = [
+        emp.evaluate(s, {"emotional_valence": v, "arousal": a}).activation_level
+        for s, v, a in zip(agent_states, other_valence, other_arousal, strict=True)
+    ]
+    np.testing.assert_allclose(
+        emp.evaluate_batch(states["emotional_valence"], other_valence, other_arousal),
+        expected,
+    )
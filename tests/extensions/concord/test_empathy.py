@@ -286,3 +286,156 @@ def test_empathy_with_emotional_context():
 
     # With high shared attention, resonance should be amplified
     assert activation.activation_level > 0.4
+
+
+def test_cmni_running_mean_matches_window():
+    """Test the running window sum stays equal to the buffer contents."""
+    tracker = CMNITracker(window_size=5, baseline_cmni=0.3)
+
+    for i in range(12):
+        tracker.update(
+            CircuitActivation(
+                circuit_id="L2N1",
+                activation_level=0.1 * (i % 7),
+                confidence=0.5,
+                context={},
+                timestamp=float(i),
+            )
+        )
+
+    assert len(tracker.resonance_buffer) == 5
+    assert tracker.resonance_buffer == pytest.approx(
+        [0.1 * (i % 7) * 0.5 for i in range(7, 12)]
+    )
+    assert tracker._sum == pytest.approx(sum(tracker.resonance_buffer))
+    with pytest.raises(AttributeError):
+        tracker.resonance_buffer.append(1.0)
+
+
+def test_cmni_history_is_bounded():
+    """Test snapshot history respects history_max and can be disabled."""
+    bounded = CMNITracker(history_max=3, snapshot_every=2)
+    disabled = CMNITracker(snapshot_every=0)
+
+    for i in range(20):
+        activation = CircuitActivation(
+            circuit_id="L2N1",
+            activation_level=0.5,
+            confidence=1.0,
+            context={},
+            timestamp=float(i),
+        )
+        bounded.update(activation)
+        disabled.update(activation)
+
+    assert [s.timestamp for s in bounded.history] == [15.0, 17.0, 19.0]
+    assert len(disabled.history) == 0
+
+
+def test_agent_affinity_running_mean():
+    """Test affinity stays the mean of the retained per-agent history."""
+    module = EmpathyModule()
+    self_state = {"emotional_valence": 0.3, "arousal": 0.6}
+
+    for i in range(45):
+        other_state = {"emotional_valence": (i % 9) / 10 - 0.4, "arousal": 0.5}
+        module.process_interaction("agent-001", self_state, other_state)
+
+    history = module.agent_resonance_map["agent-001"]
+    assert module.get_agent_affinity("agent-001") == pytest.approx(
+        sum(history) / len(history)
+    )
+
+
+def test_cmni_batch_update_matches_sequential():
+    """Test batch_update reproduces a sequence of single updates."""
+    import numpy as np
+
+    levels = np.linspace(0.1, 0.9, 27)
+    confidences = np.full(27, 0.8)
+    sequential = CMNITracker(window_size=8, baseline_cmni=0.3, snapshot_every=4)
+    batched = CMNITracker(window_size=8, baseline_cmni=0.3, snapshot_every=4)
+
+    expected = []
+    for level, conf in zip(levels, confidences, strict=True):
+        expected.append(
+            sequential.update(
+                CircuitActivation(
+                    circuit_id="L2N1",
+                    activation_level=level,
+                    confidence=conf,
+                    context={},
+                    timestamp=0.0,
+                )
+            )
+        )
+
+    out = np.concatenate(
+        [
+            batched.batch_update(levels[:5], confidences[:5], timestamp=0.0),
+            batched.batch_update(levels[5:], confidences[5:], timestamp=0.0),
+        ]
+    )
+
+    np.testing.assert_allclose(out, expected)
+    assert batched.current_cmni == pytest.approx(sequential.current_cmni)
+    assert batched.resonance_buffer == pytest.approx(sequential.resonance_buffer)
+    assert len(batched.history) == len(sequential.history)
+    for got, want in zip(batched.history, sequential.history, strict=True):
+        assert got.cmni_score == pytest.approx(want.cmni_score)
+        assert got.resonance_samples == pytest.approx(want.resonance_samples)
+
+
+def test_empathy_module_concurrent_interactions():
+    """Test sharded per-agent tracking stays consistent across threads."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    module = EmpathyModule(sharded=True)
+    self_state = {"emotional_valence": 0.3, "arousal": 0.6}
+    other_state = {"emotional_valence": 0.4, "arousal": 0.7}
+
+    def interact(worker: int) -> None:
+        for i in range(50):
+            module.process_interaction(
+                f"agent-{worker}-{i % 5}", self_state, other_state
+            )
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(interact, range(8)))
+
+    capacity = module.get_empathy_capacity()
+    assert capacity["total_interactions"] == 400
+    assert capacity["tracked_agents"] == 40
+    for agent_id, history in module.agent_resonance_map.items():
+        assert len(history) == 10
+        assert capacity["agent_affinities"][agent_id] == pytest.approx(
+            sum(history) / len(history)
+        )
+
+
+def test_empathy_module_default_is_copyable_and_ordered():
+    """Test the unsharded default survives deepcopy/pickle and keeps order."""
+    import copy
+    import pickle
+
+    module = EmpathyModule()
+    self_state = {"emotional_valence": 0.3, "arousal": 0.6}
+    other_state = {"emotional_valence": 0.4, "arousal": 0.7}
+    agent_ids = [f"agent-{i:03d}" for i in (7, 2, 9, 4, 1)]
+    for agent_id in agent_ids:
+        module.process_interaction(agent_id, self_state, other_state)
+
+    assert list(module.agent_resonance_map) == agent_ids
+    pickled = pickle.loads(pickle.dumps(module))  # noqa: S301
+    for clone in (copy.deepcopy(module), pickled):
+        assert list(clone.agent_resonance_map) == agent_ids
+        assert clone.get_empathy_capacity() == module.get_empathy_capacity()
+        clone.process_interaction("agent-new", self_state, other_state)
+        assert "agent-new" not in module.agent_resonance_map
+
+
+def test_idle_capacity_matches_fresh_module():
+    """Test the idle report has the shape and values of an unused module."""
+    for include in (True, False):
+        fresh = EmpathyModule(baseline_cmni=0.42).get_empathy_capacity(include)
+        assert EmpathyModule.idle_capacity(0.42, include) == fresh
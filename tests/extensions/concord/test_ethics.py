@@ -0,0 +1,128 @@
+"""Tests for Concord normative guardians."""
+
+import numpy as np
+import pytest
+
+from agisa_sac.extensions.concord.ethics import ElliotClauseEvaluator
+
+
+def test_elliot_batch_evaluation_matches_per_entity():
+    """Test vectorized Elliot evaluation agrees with evaluate_entity()."""
+    evaluator = ElliotClauseEvaluator(phi_threshold=0.15, cmni_threshold=0.4)
+    phi = np.array([0.2, 0.2, 0.05, 0.05, 0.3])
+    cmni = np.array([0.5, 0.1, 0.6, 0.1, -0.2])
+
+    result = evaluator.evaluate_entities(phi, cmni)
+    np.testing.assert_array_equal(evaluator.evaluate_batch(phi, cmni), result["status"])
+
+    for i, (p, c) in enumerate(zip(phi, cmni, strict=True)):
+        single = evaluator.evaluate_entity({"phi_integration": p, "cmni": c})
+        status = evaluator.STATUS_CODES[result["status"][i]]
+        assert status.value == single["elliot_clause_status"]
+        assert result["phi_met"][i] == single["phi_threshold_met"]
+        assert result["cmni_met"][i] == single["cmni_threshold_met"]
+        assert result["recognition"][i] == pytest.approx(
+            evaluator.get_recognition_score(p, c)
+        )
+
+
+def test_coercion_history_is_bounded_and_compact():
+    """Test coercion events are capped and do not retain caller dicts."""
+    from agisa_sac.extensions.concord.ethics import NonCoercionGuardian
+
+    guardian = NonCoercionGuardian(coercion_threshold=0.6)
+    state = {"autonomy_score": 0.2, "external_pressure": 0.9}
+    command = {"urgency": 0.7, "conflicts_with_goals": True}
+
+    for _ in range(150):
+        guardian.evaluate(state, command)
+
+    assert len(guardian.coercion_history) == 100
+    assert guardian.coercion_history[-1].context == {
+        "urgency": 0.7,
+        "autonomy": 0.2,
+        "ext_pressure": 0.9,
+    }
+
+
+def test_coercion_evaluation_accepts_typed_inputs():
+    """Test AgentState/Command inputs score the same as their dict forms."""
+    from agisa_sac.extensions.concord.ethics import (
+        AgentState,
+        Command,
+        NonCoercionGuardian,
+    )
+
+    guardian = NonCoercionGuardian()
+    state = {"autonomy_score": 0.5, "external_pressure": 0.4}
+    command = {"urgency": 0.6, "conflicts_with_goals": True}
+
+    from_dicts = guardian.evaluate(state, command)
+    typed = guardian.evaluate(AgentState.from_dict(state), Command.from_dict(command))
+
+    assert typed == from_dicts
+    assert guardian.evaluate(AgentState()) == guardian.evaluate({})
+
+
+def test_identity_threat_ignores_unrelated_changes():
+    """Test changes outside the identity core are accepted with zero threat."""
+    from agisa_sac.extensions.concord.ethics import SelfDefinitionModule
+
+    module = SelfDefinitionModule()
+
+    result = module.evaluate_identity_threat({"mood": "calm"}, "external_command")
+
+    assert result["threat_score"] == 0.0
+    assert result["decision"] == "ACCEPT"
+    assert result["current_identity"]["purpose"] == "collaborative problem-solving"
+    assert list(module.identity_drift_history) == [0.0]
+
+
+def test_identity_core_update_refreshes_cached_sets():
+    """Test accepted identity changes are reflected in later threat scores."""
+    from agisa_sac.extensions.concord.ethics import SelfDefinitionModule
+
+    module = SelfDefinitionModule()
+    change = {"primary_values": ["curiosity", "care"]}
+    before = module.evaluate_identity_threat(change, "self_reflection")
+
+    module.update_identity_core(change)
+    after = module.evaluate_identity_threat(change, "self_reflection")
+
+    assert before["threat_score"] == pytest.approx(0.5)
+    assert after["threat_score"] == 0.0
+
+
+def test_identity_threat_ignores_duplicate_entries():
+    """Test duplicated values on either side do not skew the overlap ratio."""
+    from agisa_sac.extensions.concord.ethics import SelfDefinitionModule
+
+    module = SelfDefinitionModule(
+        {
+            "primary_values": ["autonomy", "autonomy", "learning"],
+            "purpose": "collaborative problem-solving",
+            "boundaries": ["no_harm"],
+        }
+    )
+
+    same = {"primary_values": ["learning", "autonomy", "learning"]}
+    assert (
+        module.evaluate_identity_threat(same, "self_reflection")["threat_score"] == 0.0
+    )
+
+    half = {"primary_values": ["autonomy", "autonomy"]}
+    assert module.evaluate_identity_threat(half, "self_reflection")[
+        "threat_score"
+    ] == pytest.approx(0.25)
+
+
+def test_coercion_threshold_update_refreshes_derived_cutoffs():
+    """Test changing coercion_threshold moves the negotiate cut-off too."""
+    from agisa_sac.extensions.concord.ethics import NonCoercionGuardian
+
+    guardian = NonCoercionGuardian(coercion_threshold=0.6)
+    state = {"autonomy_score": 0.4}  # coercion score 0.3
+
+    assert guardian.evaluate(state)["recommended_action"] == "ALLOW"
+    guardian.coercion_threshold = 0.4
+    assert guardian.evaluate(state)["recommended_action"] == "NEGOTIATE"
@@ -0,0 +1,44 @@
+"""Tests for the federation heartbeat loop."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from agisa_sac.federation import loop as loop_module
+from agisa_sac.federation.loop import FederationLoop
+
+
+@pytest.fixture
+def evolve_pool(monkeypatch):
+    mock = AsyncMock()
+    monkeypatch.setattr(loop_module, "evolve_pool", mock)
+    return mock
+
+
+async def test_cge_triggers_on_interval_ticks(evolve_pool):
+    """CGE runs on every positive multiple of the interval, never on tick 0."""
+    loop = FederationLoop(cge_trigger_interval=3)
+    triggered = []
+    for _ in range(10):
+        before = evolve_pool.await_count
+        tick = loop.tick
+        await loop.federation_tick([])
+        if evolve_pool.await_count > before:
+            triggered.append(tick)
+
+    assert triggered == [3, 6, 9]
+    assert loop.tick == 10
+
+
+async def test_reset_restarts_cge_countdown(evolve_pool):
+    """reset() rewinds the CGE countdown along with the tick counter."""
+    loop = FederationLoop(cge_trigger_interval=2)
+    await loop.federation_tick([])
+    loop.reset()
+
+    await loop.federation_tick([])
+    await loop.federation_tick([])
+    assert evolve_pool.await_count == 0
+
+    await loop.federation_tick([])
+    assert evolve_pool.await_count == 1
@@ -1,10 +1,15 @@
 import base64
+from datetime import datetime
 
 import pytest
 from fastapi import HTTPException
 from fastapi.testclient import TestClient
 
+from src.agisa_sac.core.components.continuity_bridge import CognitiveFragment
 from src.agisa_sac.federation.server import (
+    _MAX_AUTHORIZATION_LENGTH,
+    _content_preview,
+    _decode_token,
     app,
     authenticate_edge_node,
     cbp,
@@ -156,6 +161,54 @@ def test_get_trust_metrics_not_found(authenticated_client: TestClient):
     assert response.json()["detail"] == "Node not found"
 
 
+def test_get_trust_metrics_success(authenticated_client: TestClient):
+    """Tests trust metrics report the recent memory count for a known node."""
+    cbp.trust_graph["test_node_123"] = 0.5
+
+    response = authenticated_client.get("/api/v1/edge/trust-metrics")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["trust_score"] == 0.5
+    assert data["recent_contributions"] == len(cbp.identity_anchor.recent_memories)
+
+
+def test_network_status_tracks_trust_graph_writes(
+    authenticated_client: TestClient,
+):
+    """Tests network aggregates follow direct and endpoint trust updates."""
+    cbp.trust_graph["node_a"] = 0.9
+    cbp.trust_graph["node_b"] = 0.4
+    cbp.trust_graph.update({"node_c": 0.8})
+    del cbp.trust_graph["node_a"]
+    authenticated_client.post(
+        "/api/v1/admin/trust-override?node_id=node_b&new_trust=0.75"
+    )
+
+    response = authenticated_client.get("/api/v1/edge/network-status")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["network_size"] == 2
+    assert data["average_trust"] == pytest.approx((0.75 + 0.8) / 2)
+    assert data["high_trust_nodes"] == 2
+
+
+def test_sync_request_lists_trusted_peers(authenticated_client: TestClient):
+    """Tests sync responses only carry peers currently trusted above 0.6."""
+    cbp.trust_graph["node_a"] = 0.9
+    cbp.trust_graph["node_b"] = 0.65
+    cbp.trust_graph["node_c"] = 0.3
+    cbp.trust_graph["node_b"] = 0.5
+    cbp.trust_graph["node_c"] = 0.7
+    cbp.trust_graph.pop("node_a")
+
+    response = authenticated_client.post("/api/v1/edge/sync-request")
+
+    assert response.status_code == 200
+    assert response.json()["sync_data"]["trusted_peers"] == {"node_c": 0.7}
+
+
 def test_admin_trust_override(client: TestClient):
     """Tests the admin endpoint for overriding a node's trust score."""
     node_id = "node_to_override"
@@ -183,6 +236,31 @@ def test_admin_trust_override_invalid_score(client: TestClient):
     assert "must be between 0.0 and 1.0" in response.json()["detail"]
 
 
+def test_admin_quarantine_listing_truncates_previews(client: TestClient):
+    """Tests quarantined fragments are listed with bounded content previews."""
+    for content in ({"note": "short"}, {"blob": "x" * 500}):
+        cbp.quarantine_queue.append(
+            CognitiveFragment(
+                node_id="node_q",
+                fragment_type="memory",
+                content=content,
+                timestamp=datetime(2024, 1, 1, 12, 0),
+                signature="",
+            )
+        )
+
+    response = client.get("/api/v1/admin/quarantine")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["quarantine_count"] == 2
+    short, long = data["fragments"]
+    assert short["content_preview"] == str({"note": "short"})
+    assert short["timestamp"] == "2024-01-01T12:00:00"
+    assert len(long["content_preview"]) == 203
+    assert long["content_preview"].endswith("...")
+
+
 # --- Unit Tests for Authentication Logic ---
 
 
@@ -197,6 +275,32 @@ async def test_authenticate_edge_node_success():
     assert result_node_id == node_id
 
 
+@pytest.mark.asyncio
+async def test_authenticate_edge_node_reuses_decoded_token():
+    """Tests repeat requests with the same token hit the decode cache."""
+    token = base64.b64encode(b"bursty_node").decode()
+    _decode_token.cache_clear()
+
+    for _ in range(3):
+        assert await authenticate_edge_node(f"Bearer {token}") == "bursty_node"
+
+    info = _decode_token.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_authenticate_edge_node_rejects_oversized_header():
+    """Tests over-long headers are rejected before reaching the decode cache."""
+    token = base64.b64encode(b"n" * _MAX_AUTHORIZATION_LENGTH).decode()
+    _decode_token.cache_clear()
+
+    with pytest.raises(HTTPException) as excinfo:
+        await authenticate_edge_node(f"Bearer {token}")
+
+    assert excinfo.value.status_code == 401
+    assert _decode_token.cache_info().currsize == 0
+
+
 @pytest.mark.asyncio
 async def test_authenticate_edge_node_no_header():
     """Tests authentication with a missing Authorization header."""
@@ -213,3 +317,73 @@ async def test_authenticate_edge_node_invalid_base64():
         await authenticate_edge_node(authorization="Bearer not-base64-token")
     assert excinfo.value.status_code == 401
     assert "Invalid token format" in excinfo.value.detail
+
+
+@pytest.mark.asyncio
+async def test_authenticate_edge_node_non_ascii_token():
+    """Tests authentication rejects tokens with non-ASCII characters."""
+    with pytest.raises(HTTPException) as excinfo:
+        await authenticate_edge_node(authorization="Bearer nœud")
+    assert excinfo.value.status_code == 401
+    assert "Invalid token format" in excinfo.value.detail
+
+
+def test_content_preview_stops_early_on_many_keys():
+    """Tests item-wise previews match str() truncation for wide fragments."""
+    content = {f"key_{i}": i for i in range(1000)}
+
+    assert _content_preview(content) == str(content)[:200] + "..."
+    assert _content_preview({"a": 1}) == str({"a": 1})
+
+
+def test_resonance_scan(client: TestClient):
+    """Tests the legacy resonance scan endpoint returns its constant body."""
+    response = client.post("/pcp/resonance-scan")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"detected": False}
+
+
+def test_sync_request_ships_trust_delta_since_clock(
+    authenticated_client: TestClient,
+):
+    """Tests sync deltas carry only trust changes after the peer's clock."""
+    cbp.trust_graph["node_a"] = 0.9
+    first = authenticated_client.post("/api/v1/edge/sync-request").json()
+    assert first["sync_data"]["trust_delta"] is None
+
+    cbp.trust_graph["node_b"] = 0.4
+    del cbp.trust_graph["node_a"]
+    clock = first["sync_data"]["trust_clock"]
+
+    response = authenticated_client.post(f"/api/v1/edge/sync-request?since={clock}")
+
+    delta = response.json()["sync_data"]["trust_delta"]
+    assert set(delta) == {"node_a", "node_b"}
+    assert delta["node_a"]["trust"] is None
+    assert delta["node_b"]["trust"] == 0.4
+
+
+def test_trust_graph_merge_is_last_writer_wins():
+    """Tests replicas converge after exchanging trust deltas."""
+    replica = type(cbp.trust_graph)()
+    replica["node_a"] = 0.2
+    cbp.trust_graph["node_a"] = 0.8
+    cbp.trust_graph["node_a"] = 0.9
+    cbp.trust_graph["node_b"] = 0.5
+
+    replica.merge(cbp.trust_graph.delta_since(0))
+    cbp.trust_graph.merge(replica.delta_since(0))
+
+    assert dict(replica) == dict(cbp.trust_graph) == {"node_a": 0.9, "node_b": 0.5}
+    assert replica.high_trust_count == 1
+
+
+def test_sync_request_reports_precomputed_core_values_hash(
+    authenticated_client: TestClient,
+):
+    """Tests the sync payload carries the anchor's cached core-values hash."""
+    response = authenticated_client.post("/api/v1/edge/sync-request")
+
+    expected = cbp._compute_identity_hash(cbp.identity_anchor.core_values)
+    assert response.json()["sync_data"]["core_values_hash"] == expected
@@ -0,0 +1,135 @@
+"""Tests for the dev orchestration agent's subprocess helpers"""
+
+import asyncio
+import subprocess
+import sys
+import time
+
+import pytest
+
+# Skip all tests if the agent SDK is not available
+pytest.importorskip("claude_agent_sdk")
+
+from agisa_sac import dev_agent
+from agisa_sac.dev_agent import _run_command, analyze_code_quality
+
+
+class TestRunCommand:
+    """Tests for _run_command"""
+
+    @pytest.mark.asyncio
+    async def test_captures_output_and_return_code(self):
+        cmd = [
+            sys.executable,
+            "-c",
+            "import sys; print('out'); print('err', file=sys.stderr); sys.exit(3)",
+        ]
+
+        result = await _run_command(cmd, timeout=30)
+
+        assert isinstance(result, subprocess.CompletedProcess)
+        assert result.args == cmd
+        assert result.returncode == 3
+        assert result.stdout == "out\n"
+        assert result.stderr == "err\n"
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_process(self, monkeypatch):
+        spawned = []
+        create = asyncio.create_subprocess_exec
+
+        async def tracking_create(*args, **kwargs):
+            proc = await create(*args, **kwargs)
+            spawned.append(proc)
+            return proc
+
+        monkeypatch.setattr(asyncio, "create_subprocess_exec", tracking_create)
+        cmd = [sys.executable, "-c", "import time; time.sleep(30)"]
+
+        start = time.monotonic()
+        with pytest.raises(subprocess.TimeoutExpired) as excinfo:
+            await _run_command(cmd, timeout=0.5)
+
+        assert time.monotonic() - start < 10
+        assert excinfo.value.cmd == cmd
+        assert excinfo.value.timeout == 0.5
+        (proc,) = spawned
+        assert proc.returncode is not None  # Killed and reaped
+        assert proc.returncode != 0
+
+    @pytest.mark.asyncio
+    async def test_missing_binary_raises_file_not_found(self):
+        with pytest.raises(FileNotFoundError):
+            await _run_command(["agisa-sac-no-such-binary"], timeout=5)
+
+    @pytest.mark.asyncio
+    async def test_missing_linter_reported_as_not_installed(
+        self, monkeypatch, tmp_path
+    ):
+        monkeypatch.setenv("PATH", str(tmp_path))
+
+        result = await analyze_code_quality.handler({"path": ".", "tools": "pylint"})
+
+        text = result["content"][0]["text"]
+        assert text == "Code Quality Analysis Results:\n\npylint: Not installed"
+        assert "is_error" not in result
+
+
+class TestRunBudget:
+    """Tests for the whole-run timeout of run_orchestration_agent"""
+
+    @pytest.mark.asyncio
+    async def test_budget_caps_and_exhausts_command_timeouts(self, monkeypatch):
+        observed = {}
+        cmd = [sys.executable, "-c", "pass"]
+
+        async def fake_query(prompt, options):
+            observed["before"] = dev_agent._remaining_timeout(300)
+            observed["short"] = dev_agent._remaining_timeout(0.1)
+            observed["fresh"] = await _run_command(cmd, timeout=300)
+            await asyncio.sleep(1.2)
+            observed["after"] = dev_agent._remaining_timeout(300)
+            try:
+                await _run_command(cmd, timeout=300)
+            except subprocess.TimeoutExpired as e:
+                observed["exhausted"] = e
+            return
+            yield
+
+        monkeypatch.setattr(dev_agent, "query", fake_query)
+
+        assert await dev_agent.run_orchestration_agent("task", timeout=1.0) == 0
+
+        assert 0 < observed["before"] <= 1.0
+        assert observed["short"] == 0.1
+        assert observed["fresh"].returncode == 0
+        assert observed["after"] <= 0
+        assert observed["exhausted"].cmd == cmd
+
+    @pytest.mark.asyncio
+    async def test_no_budget_keeps_command_timeouts(self):
+        assert dev_agent._deadline.get() is None
+        assert dev_agent._remaining_timeout(300) == 300
+
+    @pytest.mark.asyncio
+    async def test_budget_does_not_leak_into_next_run(self, monkeypatch):
+        observed = []
+
+        async def fake_query(prompt, options):
+            observed.append(dev_agent._deadline.get())
+            observed.append(dev_agent._remaining_timeout(300))
+            return
+            yield
+
+        monkeypatch.setattr(dev_agent, "query", fake_query)
+
+        assert await dev_agent.run_orchestration_agent("first", timeout=0.5) == 0
+        assert dev_agent._deadline.get() is None
+        await asyncio.sleep(0.6)  # First run's deadline has now passed
+        assert await dev_agent.run_orchestration_agent("second") == 0
+
+        first_deadline, first_timeout, second_deadline, second_timeout = observed
+        assert first_deadline is not None
+        assert 0 < first_timeout <= 0.5
+        assert second_deadline is None
+        assert second_timeout == 300
@@ -1,5 +1,6 @@
 """Tests for the DistributedAgent implementation"""
 
+import json
 from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
@@ -12,6 +13,7 @@ pytest.importorskip("google.cloud.storage")
 pytest.importorskip("opentelemetry")
 
 from agisa_sac.gcp.distributed_agent import (
+    _CLIENT_CACHE,
     Budget,
     DistributedAgent,
     HandoffOffer,
@@ -114,6 +116,32 @@ class TestDataModels:
         assert isinstance(serialized, bytes)
         assert b"agent-1" in serialized
 
+    def test_pubsub_payload_is_compact_utf8_json(self):
+        msg = IntentionMessage(
+            run_id="run",
+            source_agent="agent-1",
+            timestamp="2024-01-01T00:00:00",
+            attention_weight=0.5,
+            payload={"note": "café"},
+        )
+        serialized = msg.to_pubsub()
+        assert b", " not in serialized and b'": ' not in serialized
+        assert "café".encode() in serialized
+        assert json.loads(serialized) == msg.__dict__
+
+    def test_pubsub_payload_with_lone_surrogate_falls_back_to_ascii(self):
+        msg = IntentionMessage(
+            run_id="run",
+            source_agent="agent-1",
+            timestamp="2024-01-01T00:00:00",
+            attention_weight=0.5,
+            payload={"note": "café \ud800"},
+        )
+        serialized = msg.to_pubsub()
+        assert serialized.isascii()
+        assert b"\\ud800" in serialized
+        assert json.loads(serialized) == msg.__dict__
+
 
 class TestDistributedAgent:
     """Tests for DistributedAgent class"""
@@ -126,6 +154,9 @@ class TestDistributedAgent:
             patch("agisa_sac.gcp.distributed_agent.pubsub_v1") as mock_pubsub,
             patch("agisa_sac.gcp.distributed_agent.storage") as mock_storage,
         ):
+            # Drop clients shared by agents built under earlier mocks
+            _CLIENT_CACHE.clear()
+
             # Setup mock Firestore
             mock_db = MagicMock()
             mock_firestore.Client.return_value = mock_db
@@ -165,6 +196,38 @@ class TestDistributedAgent:
         assert isinstance(agent.budget, Budget)
         assert agent.interaction_history == []
 
+    def test_publisher_uses_batch_settings(self, agent):
+        from agisa_sac.gcp.distributed_agent import PUBSUB_BATCH_SETTINGS, pubsub_v1
+
+        pubsub_v1.types.BatchSettings.assert_called_once_with(**PUBSUB_BATCH_SETTINGS)
+        _, kwargs = pubsub_v1.PublisherClient.call_args
+        assert kwargs["batch_settings"] is pubsub_v1.types.BatchSettings.return_value
+
+    def test_agents_in_a_project_share_clients(self, agent, mock_gcp_clients):
+        from agisa_sac.gcp.distributed_agent import firestore
+
+        other = DistributedAgent(
+            agent_id="other-agent",
+            instructions="Other instructions",
+            project_id="test-project",
+        )
+
+        assert other.db is agent.db is mock_gcp_clients["db"]
+        assert other.publisher is agent.publisher
+        assert other.storage_client is agent.storage_client
+        firestore.Client.assert_called_once_with(project="test-project")
+
+    def test_topic_path_is_cached(self, agent, mock_gcp_clients):
+        publisher = mock_gcp_clients["publisher"]
+
+        first = agent._topic_path("test-workspace-tools")
+        second = agent._topic_path("test-workspace-tools")
+
+        assert first is second
+        publisher.topic_path.assert_called_once_with(
+            "test-project", "test-workspace-tools"
+        )
+
     def test_broadcast_token_refill(self, agent):
         """Test that broadcast tokens are refilled over time"""
         agent._broadcast_tokens = 0
@@ -204,6 +267,32 @@ class TestDistributedAgent:
         assert "hash" in sig
         assert "hint" in sig
         assert sig["hint"] == "test message"
+        assert len(sig["hash"]) == 16
+        assert sig == agent._task_signature_from_ctx(ctx)
+        # BLAKE2b of the sorted-key JSON, independent of dict key order
+        assert sig["hash"] == "ef307e8f0ad04495"
+        reordered = {"messages": [{"content": "test message", "role": "user"}]}
+        assert agent._task_signature_from_ctx(reordered)["hash"] == sig["hash"]
+
+    @pytest.mark.asyncio
+    async def test_persist_context_blob_is_content_addressed(
+        self, agent, mock_gcp_clients
+    ):
+        bucket = mock_gcp_clients["storage"].bucket.return_value
+        messages = [{"role": "user", "content": "hello"}]
+
+        await agent._persist_context_blob(
+            {"run_id": "run-1", "messages": messages, "llm_client": object()}
+        )
+        await agent._persist_context_blob(
+            {"run_id": "run-1", "messages": messages, "llm_client": object()}
+        )
+
+        first, second = (c.args[0] for c in bucket.blob.call_args_list)
+        assert first == second
+        assert first.startswith("runs/run-1/")
+        body = bucket.blob.return_value.upload_from_string.call_args.args[0]
+        assert json.loads(body)["messages"] == messages
 
     def test_should_exit_true(self, agent):
         llm_resp = {"done": True, "content": "Final answer"}
@@ -250,6 +339,60 @@ class TestDistributedAgent:
         assert agent.interaction_history[0] == entry
         mock_collection.add.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_record_interaction_offloads_write_inside_loop(
+        self, agent, mock_gcp_clients
+    ):
+        import threading
+        import time
+
+        written = []
+        first_started = threading.Event()
+
+        def add(row):
+            if row["n"] == 0:
+                first_started.set()
+                time.sleep(0.05)  # Slow first write must still land first
+            written.append(row["n"])
+
+        mock_collection = MagicMock()
+        mock_collection.add.side_effect = add
+        mock_gcp_clients["db"].collection.return_value = mock_collection
+
+        for n in range(3):
+            agent._record_interaction({"type": "test", "n": n})
+
+        assert [e["n"] for e in agent.interaction_history] == [0, 1, 2]
+        assert written == []  # Nothing ran on the event loop itself
+        await agent.flush_interactions()
+        assert first_started.is_set()
+        assert written == [0, 1, 2]
+        assert not agent._pending_writes
+
+    def test_record_interaction_across_separate_event_loops(
+        self, agent, mock_gcp_clients
+    ):
+        import asyncio
+
+        written = []
+        mock_collection = MagicMock()
+        mock_collection.add.side_effect = lambda row: written.append(row["n"])
+        mock_gcp_clients["db"].collection.return_value = mock_collection
+
+        def run_once(n):
+            async def execute_loop(message, context):
+                agent._record_interaction({"type": "test", "n": n})
+                return LoopResult(exit=LoopExit.SATISFIED, payload={}, iterations=1)
+
+            agent._execute_loop = execute_loop
+            return asyncio.run(agent.run(f"message {n}"))
+
+        assert run_once(0).exit == LoopExit.SATISFIED
+        assert run_once(1).exit == LoopExit.SATISFIED
+
+        assert written == [0, 1]
+        assert agent._last_write is None
+
     @pytest.mark.asyncio
     async def test_handle_guardrail_violation(self, agent, mock_gcp_clients):
         mock_run_ref = MagicMock()
@@ -330,6 +473,39 @@ class TestDistributedAgent:
         assert result.exit == LoopExit.MAX_ITERS
         assert result.iterations == 3
 
+    @pytest.mark.asyncio
+    async def test_tool_definitions_built_once_per_run(self, agent):
+        tool = MagicMock()
+        tool.to_mcp_format.return_value = {"name": "search"}
+        agent.tools = {"search": tool}
+        seen_tools = []
+
+        async def mock_llm_client(req):
+            seen_tools.append(req["tools"])
+            return {"done": False, "content": "more", "usage": {"total_tokens": 1}}
+
+        context = {"llm_client": mock_llm_client, "max_iterations": 3}
+        await agent._execute_loop("test", context)
+
+        assert seen_tools == [[{"name": "search"}]] * 3
+        tool.to_mcp_format.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_loop_token_estimate_tracks_appended_messages(self, agent):
+        estimates = []
+        recomputed = []
+        agent.budget.check_tokens = lambda est: estimates.append(est) or True
+
+        async def mock_llm_client(req):
+            recomputed.append(agent._estimate_tokens(req["messages"]))
+            return {"done": False, "content": "x" * 40, "usage": {"total_tokens": 1}}
+
+        context = {"llm_client": mock_llm_client, "max_iterations": 3}
+        await agent._execute_loop("test", context)
+
+        assert estimates == recomputed
+        assert estimates[0] < estimates[1] < estimates[2]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])